@@ -0,0 +1,229 @@
+"""Headless HTTP/JSON API for playing Monty Hall games.
+
+A small asyncio HTTP/1.1 server (keep-alive, no dependencies beyond the
+standard library) over the same rules as the Streamlit page:
+
+    POST /games                 {"doors": 3}              -> new game
+    POST /games/<id>/pick       {"door": 0}               -> the host's reveal
+    POST /games/<id>/decide     {"choice": "switch"}      -> the result
+    GET  /games/<id>                                      -> current state
+    GET  /metrics                                         -> Prometheus metrics
+
+Games live in an in-memory :class:`~game_table.GameTable` and are evicted
+after ``--ttl`` seconds without a request. Run it with:
+
+    python api.py --port 8000
+"""
+
+import argparse
+import asyncio
+import json
+
+import metrics
+from game import MontyHallGame
+from game_table import GameTable
+from seeding import make_rng, new_seed
+
+# Largest games whose opened doors are listed in responses
+MAX_LISTED_DOORS = 100
+
+# Most doors a game may have
+MAX_DOORS = 1_000_000
+
+# Most doors the host's reveal may have to draw (the smaller of the opened
+# doors and the other doors left closed), since it runs on the event loop
+MAX_REVEAL_DRAWS = 10_000
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+}
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def integer_field(data, key, default=None, required=False):
+    """``data[key]`` if it is a JSON integer; floats, strings and booleans are refused, not truncated."""
+    value = data.get(key, default)
+    if value is None and not required:
+        return None
+    if type(value) is not int:
+        raise ApiError(400, f'"{key}" must be an integer')
+    return value
+
+
+def game_state(game_id, game):
+    state = {"id": game_id, "doors": game.n_doors, "reveals": game.n_reveals, "pick": game.pick}
+    if game.revealed:
+        if game.n_doors <= MAX_LISTED_DOORS:
+            state["opened"] = game.opened_doors()
+        state["switch_door"] = game.switch_door
+    if game.final is not None:
+        state.update(final=game.final, car=game.car, won=game.won)
+    return state
+
+
+class GameServer:
+    """Routes JSON requests to games kept in a TTL-evicting table.
+
+    The server runs on a single event loop, so one generator (seeded with
+    ``seed``) serves every game without locking.
+    """
+
+    def __init__(self, ttl=600.0, seed=None):
+        self.seed = new_seed() if seed is None else seed
+        self.rng = make_rng(self.seed)
+        self.table = GameTable(ttl)
+        metrics.ACTIVE_SESSIONS.function = self.table.__len__
+
+    def dispatch(self, method, path, body):
+        """Handle one request and return ``(status, payload)``.
+
+        The payload is a JSON-serializable object, or text for ``/metrics``.
+        """
+        try:
+            parts = path.strip("/").split("/")
+            if parts == ["metrics"] and method == "GET":
+                return 200, metrics.render()
+            if parts[0] != "games" or len(parts) > 3:
+                raise ApiError(404, "not found")
+            data = json.loads(body) if body else {}
+            if not isinstance(data, dict):
+                raise ApiError(400, "expected a JSON object")
+            if len(parts) == 1:
+                if method != "POST":
+                    raise ApiError(405, "use POST to start a game")
+                return 201, self.new_game(data)
+            game_id, game = self._lookup(parts[1])
+            action = parts[2] if len(parts) == 3 else None
+            if action is None and method == "GET":
+                return 200, game_state(game_id, game)
+            if method != "POST":
+                raise ApiError(405, "use POST for game actions")
+            if action == "pick":
+                if game.revealed or game.final is not None:
+                    raise ApiError(409, "this game already has a pick")
+                door = integer_field(data, "door", required=True)
+                if not 0 <= door < game.n_doors:
+                    raise ApiError(400, f"door must be between 0 and {game.n_doors - 1}")
+                game.pick_door(door)
+                game.reveal()
+                metrics.DOOR_PICKS.inc()
+            elif action == "decide":
+                self._decide(game, data)
+            else:
+                raise ApiError(404, "not found")
+            return 200, game_state(game_id, game)
+        except ApiError as error:
+            return error.status, {"error": str(error)}
+        except (KeyError, OverflowError, TypeError, ValueError) as error:
+            return 400, {"error": str(error) or "bad request"}
+
+    def new_game(self, data):
+        n_doors = integer_field(data, "doors", 3)
+        if n_doors > MAX_DOORS:
+            raise ApiError(400, f"a game can have at most {MAX_DOORS:,} doors")
+        game = MontyHallGame(n_doors, integer_field(data, "reveals"), rng=self.rng)
+        if min(game.n_reveals, n_doors - 1 - game.n_reveals) > MAX_REVEAL_DRAWS:
+            raise ApiError(
+                400, f"the host can open at most {MAX_REVEAL_DRAWS:,} doors, or leave at most that many closed"
+            )
+        return game_state(self.table.add(game), game)
+
+    def _lookup(self, raw_id):
+        game_id = int(raw_id) if raw_id.isdigit() else None
+        game = self.table.get(game_id) if game_id is not None else None
+        if game is None:
+            raise ApiError(404, "no such game (it may have expired)")
+        return game_id, game
+
+    @staticmethod
+    def _decide(game, data):
+        if game.final is not None:
+            raise ApiError(409, "this game has already been decided")
+        choice = data.get("choice")
+        if choice == "stay":
+            game.stay()
+        elif choice == "switch":
+            game.switch(integer_field(data, "door"))
+        else:
+            raise ApiError(400, 'choice must be "stay" or "switch"')
+        metrics.record_decision(game, choice)
+
+    async def handle(self, reader, writer):
+        """Serve requests on one keep-alive connection."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = self.dispatch(method, path, body)
+                if isinstance(payload, str):
+                    data, content_type = payload.encode(), metrics.CONTENT_TYPE.encode()
+                else:
+                    data, content_type = json.dumps(payload).encode(), b"application/json"
+                writer.write(
+                    b"HTTP/1.1 %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n\r\n%s"
+                    % (status, REASONS[status].encode(), content_type, len(data), data)
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, OverflowError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def sweep(self):
+        """Evict expired games in the background."""
+        while True:
+            await asyncio.sleep(max(self.table.ttl / 4, 1.0))
+            self.table.evict()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        sweeper = asyncio.create_task(self.sweep())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Monty Hall game API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--ttl", type=float, default=600.0, help="seconds before an idle game is evicted")
+    parser.add_argument("--seed", type=int, help="seed for reproducible games")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.ttl, args.seed)
+    print(f"Serving on http://{args.host}:{args.port} (seed {server.seed})")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
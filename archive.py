@@ -0,0 +1,270 @@
+"""Compact archives of three-door games, and bounded-memory replay.
+
+Every game is packed into one byte and written to a ``.npy`` file through a
+memory map, so an archive of 10^9 games is 1 GB on disk and never has to fit
+in RAM:
+
+    bits 0-1  car        door hiding the car
+    bits 2-3  pick       the player's first pick
+    bits 4-5  reveal     the door the host opened (3 if unknown, see below)
+    bit  6    switched   1 if the player switched
+    bit  7    won        1 if the final door hid the car
+
+Two bits per door only fit three-door games, so that is all an archive holds.
+Next to each archive, ``<path>.json`` records its door count, host policy,
+player, seed and source, and how many logged games were skipped because they
+had more doors.
+
+:func:`export_simulation` archives a seeded simulation (by default the same
+games :func:`simulation.simulate` plays for that seed, or games against any
+host of :mod:`policies`, with a coin-flip player) and :func:`export_log`
+archives the three-door games in the SQLite game log. :func:`replay` streams
+an archive in chunks and only keeps a count of each of the 256 byte values,
+which is enough to recompute the stay/switch results and any
+per-configuration breakdown:
+
+    python archive.py simulate runs.npy --trials 1000000000 --seed 1 [--host fall]
+    python archive.py log games.npy
+    python archive.py replay runs.npy
+"""
+
+import argparse
+import json
+import sqlite3
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from game_log import DEFAULT_PATH, create_schema
+from policies import HOSTS, CoinFlip
+from seeding import make_rng, new_seed, spawn_seeds
+from simulation import CHUNK_SIZE, SimulationResult, chunk_sizes, play_trials, revealed_door
+
+# Reveal value of games logged before the log stored the opened door, where
+# the player stayed on the car so either goat door could have been opened
+REVEAL_UNKNOWN = 3
+
+# Door count of every archived game, the most two bits per door can hold
+N_DOORS = 3
+
+# Hosts of :mod:`policies` by their command-line name; the standard host is the
+# default, played with the streams of :func:`simulation.simulate`
+HOST_CHOICES = dict(zip(("standard", "fall", "biased", "crawl"), HOSTS))
+STANDARD_HOST = HOSTS[0]
+
+
+def pack(car, pick, reveal, switched, won):
+    """Pack arrays of game fields into one ``uint8`` per game."""
+    return (
+        car.astype(np.uint8)
+        | pick.astype(np.uint8) << 2
+        | reveal.astype(np.uint8) << 4
+        | switched.astype(np.uint8) << 6
+        | won.astype(np.uint8) << 7
+    )
+
+
+def unpack(records):
+    """``(car, pick, reveal, switched, won)`` arrays of packed games."""
+    return records & 3, records >> 2 & 3, records >> 4 & 3, records >> 6 & 1, records >> 7
+
+
+def config_path(path):
+    """Where the configuration of the archive at ``path`` is kept."""
+    return path + ".json"
+
+
+def write_config(path, **config):
+    with open(config_path(path), "w") as f:
+        json.dump({"n_doors": N_DOORS, **config}, f, indent=2)
+
+
+def read_config(path):
+    """The configuration stored with the archive at ``path``, or ``{}`` if there is none."""
+    try:
+        with open(config_path(path)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def export_simulation(path, n_trials, seed=None, chunk_size=CHUNK_SIZE, host=None):
+    """Play ``n_trials`` seeded games and archive them to ``path``; returns the seed.
+
+    Each game is decided by a fair coin, so both decisions appear in the
+    archive. Without ``host`` the standard host plays on the chunk seeds of
+    :func:`simulation.simulate`, so replaying gives exactly its stay/switch
+    counts for the same seed and chunk size. With a :mod:`policies` host the
+    games follow that host's reveals; those that reveal the car are archived
+    too, and replay leaves them out as void.
+    """
+    if seed is None:
+        seed = new_seed()
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(n_trials,))
+    sizes = chunk_sizes(n_trials, chunk_size)
+    start = 0
+    for n, chunk_seed in zip(sizes, spawn_seeds(seed, len(sizes))):
+        rng = make_rng(chunk_seed)
+        if host is None:
+            car, pick, switch = play_trials(n, rng)
+            opened = revealed_door(pick, switch)
+        else:
+            car = rng.integers(0, N_DOORS, n, dtype=np.uint8)
+            pick = rng.integers(0, N_DOORS, n, dtype=np.uint8)
+            opened = host.reveal(car, pick, rng)
+            switch = revealed_door(pick, opened)
+        switched = rng.random(n) < 0.5
+        final = np.where(switched, switch, pick)
+        out[start:start + n] = pack(car, pick, opened, switched, final == car)
+        start += n
+    out.flush()
+    del out
+    write_config(path, host=(host or STANDARD_HOST).name, player=CoinFlip.name, seed=seed, source="simulation")
+    return seed
+
+
+def export_log(path, log_path=DEFAULT_PATH, chunk_size=CHUNK_SIZE):
+    """Archive the three-door games of the SQLite game log to ``path``.
+
+    Returns ``(archived, skipped)``: games with more doors don't fit the
+    format and are counted as skipped. The log stores the door the host
+    opened; for rows logged before it did, the reveal is recovered from the
+    car, pick and final door, except after a stay on the car, where it is
+    ``REVEAL_UNKNOWN``.
+    """
+    conn = sqlite3.connect(log_path)
+    try:
+        create_schema(conn)
+        # Games logged while exporting are left for the next export
+        count, skipped, last_id = conn.execute(
+            "SELECT COUNT(*) FILTER (WHERE n_doors = ?), COUNT(*) FILTER (WHERE n_doors != ?), MAX(id) FROM games",
+            (N_DOORS, N_DOORS),
+        ).fetchone()
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(count,))
+        cursor = conn.execute(
+            "SELECT car, pick, final, switched, won, COALESCE(opened, ?) FROM games"
+            " WHERE n_doors = ? AND id <= ? ORDER BY id",
+            (REVEAL_UNKNOWN, N_DOORS, last_id or 0),
+        )
+        start = 0
+        while rows := cursor.fetchmany(chunk_size):
+            car, pick, final, switched, won, opened = np.array(rows, dtype=np.uint8).T
+            recovered = np.where(switched == 1, 3 - pick - final, np.where(car == pick, REVEAL_UNKNOWN, 3 - car - pick))
+            reveal = np.where(opened == REVEAL_UNKNOWN, recovered, opened)
+            out[start:start + len(rows)] = pack(car, pick, reveal, switched, won)
+            start += len(rows)
+        out.flush()
+        del out
+    finally:
+        conn.close()
+    write_config(path, host=STANDARD_HOST.name, player="logged decisions", source=log_path, skipped_games=skipped)
+    return count, skipped
+
+
+# Fields of every possible packed byte, to read aggregates off a histogram
+_CAR, _PICK, _REVEAL, _SWITCHED, _WON = unpack(np.arange(256, dtype=np.uint8))
+_VALID = _REVEAL != _CAR
+
+
+@dataclass(frozen=True)
+class ArchiveSummary:
+    """Games per packed byte value of an archive, and the statistics they determine."""
+
+    counts: np.ndarray  # 256 entries
+    config: dict = field(default_factory=dict)  # what the archive's sidecar recorded
+
+    @property
+    def trials(self):
+        """Games where the host opened a goat door; the rest are void."""
+        return self._total(_VALID)
+
+    @property
+    def void(self):
+        """Games where the host revealed the car (only hosts that don't know where it is do)."""
+        return int(self.counts.sum()) - self.trials
+
+    def _total(self, mask):
+        return int(self.counts[mask & _VALID].sum())
+
+    def result(self):
+        """What always staying and always switching would have won on these games."""
+        return SimulationResult(self.trials, self._total(_PICK == _CAR), self._total(_PICK != _CAR))
+
+    def decisions(self):
+        """``{"stay"|"switch": (games, wins)}`` for the decisions actually made."""
+        return {
+            name: (self._total(_SWITCHED == switched), self._total((_SWITCHED == switched) & (_WON == 1)))
+            for name, switched in (("stay", 0), ("switch", 1))
+        }
+
+    def by_configuration(self):
+        """``(pick, reveal, games, stay_wins, switch_wins)`` for every pick and reveal seen."""
+        rows = []
+        for pick in range(N_DOORS):
+            for reveal in range(4):
+                mask = (_PICK == pick) & (_REVEAL == reveal)
+                games = self._total(mask)
+                if games:
+                    rows.append((pick, reveal, games, self._total(mask & (_PICK == _CAR)), self._total(mask & (_PICK != _CAR))))
+        return rows
+
+
+def replay(path, chunk_size=CHUNK_SIZE):
+    """Summarize the archive at ``path``, reading ``chunk_size`` games at a time."""
+    records = np.load(path, mmap_mode="r")
+    counts = np.zeros(256, dtype=np.int64)
+    for start in range(0, len(records), chunk_size):
+        counts += np.bincount(records[start:start + chunk_size], minlength=256)
+    return ArchiveSummary(counts, read_config(path))
+
+
+def print_summary(summary):
+    config = summary.config
+    if config:
+        seed = f", seed {config['seed']}" if "seed" in config else ""
+        print(f"{config['n_doors']}-door games from {config['source']}: {config['host']}, {config['player']}{seed}")
+    result = summary.result()
+    print(f"{result.trials:,} games")
+    if summary.void:
+        print(f"  {summary.void:,} void games where the host revealed the car are left out")
+    print(f"  always stay:   {result.stay_rate:.4%} ({result.stay_wins:,} wins)")
+    print(f"  always switch: {result.switch_rate:.4%} ({result.switch_wins:,} wins)")
+    for name, (games, wins) in summary.decisions().items():
+        if games:
+            print(f"  players who chose {name}: {wins / games:.4%} of {games:,} games")
+    print("  pick  reveal         games  stay rate  switch rate")
+    for pick, reveal, games, stay_wins, switch_wins in summary.by_configuration():
+        opened = "?" if reveal == REVEAL_UNKNOWN else reveal + 1
+        print(f"  {pick + 1:>4}  {opened:>6}  {games:>12,}  {stay_wins / games:>9.2%}  {switch_wins / games:>11.2%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    simulate = commands.add_parser("simulate", help="archive a seeded simulation")
+    simulate.add_argument("path")
+    simulate.add_argument("--trials", type=float, default=1e6)
+    simulate.add_argument("--seed", type=int)
+    simulate.add_argument("--host", choices=HOST_CHOICES, default="standard", help="host policy (default: standard)")
+    log = commands.add_parser("log", help="archive the games in the SQLite game log")
+    log.add_argument("path")
+    log.add_argument("--db", default=DEFAULT_PATH)
+    replayed = commands.add_parser("replay", help="summarize an archive")
+    replayed.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "simulate":
+        host = None if args.host == "standard" else HOST_CHOICES[args.host]
+        seed = export_simulation(args.path, int(args.trials), args.seed, host=host)
+        print(f"Archived {int(args.trials):,} games to {args.path} (seed {seed})")
+    elif args.command == "log":
+        count, skipped = export_log(args.path, args.db)
+        print(f"Archived {count:,} logged {N_DOORS}-door games to {args.path}")
+        if skipped:
+            print(f"Skipped {skipped:,} games with more doors: the one-byte format only holds {N_DOORS}-door games")
+    else:
+        print_summary(replay(args.path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Static HTML and CSS for the Monty Hall page.
+
+Everything here is built once per server process when the module is first
+imported, then reused by every rerun of every session. Markup is collapsed to
+single lines so each rerun sends as few bytes as possible.
+"""
+
+import re
+
+# The banner (static/banner.png) is served by this server through Streamlit's
+# static file serving (see .streamlit/config.toml), so first paint doesn't
+# wait on a third-party image host
+BANNER_URL = "app/static/banner.png"
+
+
+def _minify(html):
+    html = re.sub(r"/\*.*?\*/", "", html, flags=re.S)
+    return re.sub(r"\s+", " ", html).strip()
+
+
+BANNER_HTML = f'<img src="{BANNER_URL}" alt="Monty Hall Game" style="width: 100%;">'
+
+PAGE_CSS = _minify("""
+<style>
+    /* Global font settings */
+    * {
+        font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif;
+    }
+    
+    /* Header styling */
+    h1, h2, h3, h4, h5, h6 {
+        font-weight: 600;
+        color: #2c3e50;
+    }
+    
+    /* Make buttons more appealing */
+    .stButton button {
+        font-weight: 500;
+        border-radius: 8px;
+        transition: all 0.3s ease;
+    }
+    
+    /* Add hover effects to buttons */
+    .stButton button:hover:enabled {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+    }
+    
+    /* Improve radio buttons */
+    .stRadio > div {
+        padding: 10px;
+        border-radius: 8px;
+        background-color: #f8f9fa;
+    }
+    
+    /* Door buttons styling */
+    .door-button {
+        padding: 30px 0 !important;
+        font-size: 18px !important;
+        margin: 10px 0 !important;
+        width: 100% !important;
+        height: 100% !important;
+        display: block !important;
+    }
+    
+    /* Make success and error messages more prominent */
+    .stSuccess, .stError, .stInfo {
+        padding: 15px;
+        border-radius: 8px;
+        margin: 15px 0;
+    }
+    
+    /* Game info box */
+    .game-info {
+        padding: 25px;
+        background-color: #f8f9fa;
+        border-radius: 10px;
+        width: 100%;
+        line-height: 1.6;
+        font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif;
+        word-break: break-word;
+        border-left: 5px solid #3498db;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.05);
+    }
+    
+    /* Door container */
+    .door-container {
+        display: flex;
+        justify-content: space-around;
+        padding: 20px 0;
+    }
+    
+    /* Door item */
+    .door {
+        text-align: center;
+        transition: all 0.3s ease;
+    }
+    
+    /* Footer styling */
+    .footer-text {
+        font-size: 13px;
+        color: #7f8c8d;
+        line-height: 1.5;
+    }
+    
+    .footer-text a, .footer-text a:visited, .footer-text a:active {
+        font-size: 13px !important;
+        text-decoration: none;
+        color: #e67e22 !important;
+        font-weight: bold;
+        transition: color 0.2s ease;
+    }
+    
+    .footer-text a:hover {
+        color: #d35400 !important;
+    }
+    
+    /* Divider */
+    hr {
+        margin: 30px 0;
+        border: 0;
+        height: 1px;
+        background-image: linear-gradient(to right, rgba(0,0,0,0), rgba(0,0,0,0.1), rgba(0,0,0,0));
+    }
+    
+    /* Section separator */
+    .section {
+        margin: 30px 0;
+    }
+    
+    /* Results animation */
+    @keyframes fadeIn {
+        from { opacity: 0; transform: translateY(10px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    
+    .result-animation {
+        animation: fadeIn 0.5s ease-out forwards;
+    }
+    
+    /* Full height door buttons */
+    .door-button-container button {
+        height: 60px !important;
+        display: flex !important;
+        justify-content: center !important;
+        align-items: center !important;
+        font-size: 24px !important;
+        border-radius: 8px !important;
+        transition: all 0.3s ease !important;
+        border: 2px solid #9e9e9e !important;
+        background-color: #f5f5f5 !important;
+        color: #333 !important;
+        padding: 10px !important;
+        margin-top: 5px !important;
+        width: 100% !important;
+    }
+    
+    /* Door icon styling */
+    .door-button-container button {
+        font-size: 100px !important;
+        font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif !important;
+    }
+    
+    .door-button-container button:hover:enabled {
+        transform: translateY(-5px) !important;
+        box-shadow: 0 8px 15px rgba(0,0,0,0.1) !important;
+    }
+    
+    /* Door button selected state */
+    .door-chosen button {
+        border: 2px solid #2196f3 !important;
+        background-color: #e3f2fd !important;
+    }
+    
+    /* Door button revealed state */
+    .door-revealed button {
+        border: 2px solid #f44336 !important;
+        background-color: #ffebee !important;
+    }
+    
+    /* Make sure all door button content uses Helvetica */
+    .door-button-container button div {
+        font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif !important;
+    }
+</style>
+""")
+
+INSTRUCTIONS_HTML = _minify("""
+<div class="game-info">
+    <h4 style="text-align: center; margin-bottom: 15px; color: #3498db;">🎮 How to Play: Read First!</h4>
+    <div style="text-align: justify; margin-bottom: 15px;">
+        Imagine you're on a thrilling game show, standing in front of three closed doors. 
+        Behind one of them is the <b>grand prize – a brand-new car</b>! The other two hide goats. 
+        Your goal? To drive away in that car!
+    </div>
+    <div style="margin: 20px 0;">
+        <div style="margin-bottom: 10px;"><span style="display:inline-block; background-color: #3498db; color: white; border-radius: 50%; width: 25px; height: 25px; text-align: center; margin-right: 10px;">1</span> Pick a door (1, 2, or 3) – one of them hides the grand prize!</div>
+        <div style="margin-bottom: 10px;"><span style="display:inline-block; background-color: #3498db; color: white; border-radius: 50%; width: 25px; height: 25px; text-align: center; margin-right: 10px;">2</span> The host, Monty Hall, who knows exactly where the car is, will open a different door to reveal a goat.</div>
+        <div style="margin-bottom: 10px;"><span style="display:inline-block; background-color: #3498db; color: white; border-radius: 50%; width: 25px; height: 25px; text-align: center; margin-right: 10px;">3</span> Now, you have a decision to make: Stick with your original choice or switch to the remaining closed door.</div>
+        <div style="margin-bottom: 10px;"><span style="display:inline-block; background-color: #3498db; color: white; border-radius: 50%; width: 25px; height: 25px; text-align: center; margin-right: 10px;">4</span> Final reveal: The door you chose is opened – did you win the car or end up with a goat?</div>
+    </div>
+    <div style="text-align: justify; font-size: 15px; margin-top: 15px; padding: 10px; background-color: #fff3cd; border-left: 4px solid #ffc107; border-radius: 4px;">
+        ⚠️ <b>Heads up!</b> This app follows probability rules—the door with the highest probability will always have the car behind it!
+    </div>
+</div>
+""")
+
+SWITCH_EXPLANATION_TEMPLATE = _minify("""
+<div style="padding: 20px; background-color: #e1f5fe; border-radius: 8px; margin: 20px 0; border-left: 4px solid #03a9f4;">
+    <h4 style="color: #0277bd;">📊 By switching, you had a <b>{switch}</b> chance of winning the car.</h4>
+    <p>This happens because:</p>
+    <ul>
+        <li>Your first pick had a <b>{stay}</b> chance of being the car</li>
+        <li>The other two doors together had a <b>{others}</b> chance</li>
+        <li>When Monty reveals a goat, that <b>{others}</b> probability shifts to the remaining door</li>
+        <li>Switching means you're betting that your original choice was wrong—which is statistically more likely</li>
+    </ul>
+    <p>The Monty Hall Problem demonstrates how our intuition about probability can be misleading!</p>
+</div>
+""")
+
+STAY_EXPLANATION_TEMPLATE = _minify("""
+<div style="padding: 20px; background-color: #ffebee; border-radius: 8px; margin: 20px 0; border-left: 4px solid #f44336;">
+    <h4 style="color: #c62828;">📊 By staying, you only had a <b>{stay}</b> chance of winning the car.</h4>
+    <p>This happens because:</p>
+    <ul>
+        <li>Your initial choice was random with only a <b>{stay}</b> chance of being correct</li>
+        <li>Revealing a goat doesn't change this initial probability</li>
+        <li>The remaining door has a <b>{switch}</b> probability of hiding the car</li>
+        <li>This is why switching is the mathematically optimal strategy!</li>
+    </ul>
+    <p>The Monty Hall Problem is counter-intuitive, but the math doesn't lie!</p>
+</div>
+""")
+
+# The box for the strategy the player used comes first; the {stay}, {switch}
+# and {others} odds are filled in from the exact probability engine
+WIN_EXPLANATION_TEMPLATE = SWITCH_EXPLANATION_TEMPLATE + STAY_EXPLANATION_TEMPLATE
+LOSS_EXPLANATION_TEMPLATE = STAY_EXPLANATION_TEMPLATE + SWITCH_EXPLANATION_TEMPLATE
+
+FOOTER_HTML = (
+    "<p class='footer-text'><b>The Monty Hall Problem Explained</b></p><p class='footer-text'>The Monty Hall problem reveals how human intuition often struggles with probability and decision-making under uncertainty. It highlights several cognitive biases and reasoning errors that influence how we think.</p><p class='footer-text'><a href='https://behavioralscientist.org/steven-pinker-rationality-why-you-should-always-switch-the-monty-hall-problem-finally-explained/'>Read more</a></p>",
+    "<p class='footer-text'><b>How can this improve your everyday choices?</b></p><p class='footer-text'>Think of it like picking a checkout line at the grocery store. If a new lane opens up and is moving faster, switching could increase your chances of getting through quicker. The Monty Hall concept teaches us that sometimes, reconsidering our choices based on new information can lead to better outcomes.</p>",
+    "<p class='footer-text'><b>Behind the Build</b></p><p class='footer-text'>Created by <a href='https://ifiecas.com/'><b>Ivy Fiecas-Borjal</b></a></p><p class='footer-text'>Inspired by the Predictive Analytics class discussion with Dr. Omid Sianaki from Victoria University, Melbourne, Australia (Feb 2025).</p>",
+)
+
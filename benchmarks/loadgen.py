@@ -0,0 +1,110 @@
+"""Load generator for the headless game API.
+
+Opens ``--connections`` keep-alive connections and has each play full games
+(new game, pick, decide) as fast as the server answers, then reports the
+request rate and p50/p99 latency per endpoint:
+
+    python api.py --port 8000 &
+    python benchmarks/loadgen.py --port 8000 --connections 64 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.writer.write(
+            b"%s %s HTTP/1.1\r\nHost: api\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s"
+            % (method.encode(), path.encode(), len(body), body)
+        )
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value)
+        data = json.loads(await self.reader.readexactly(length))
+        if status >= 400:
+            raise RuntimeError(f"{method} {path} -> {status}: {data}")
+        return data
+
+
+async def play(host, port, deadline, latencies, doors):
+    reader, writer = await asyncio.open_connection(host, port)
+    client = Client(reader, writer)
+    wins = defaultdict(int)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            game = await client.request("POST", "/games", {"doors": doors})
+            picked = time.perf_counter()
+            latencies["new game"].append(picked - start)
+            await client.request("POST", f"/games/{game['id']}/pick", {"door": random.randrange(doors)})
+            decided = time.perf_counter()
+            latencies["pick"].append(decided - picked)
+            choice = random.choice(("stay", "switch"))
+            result = await client.request("POST", f"/games/{game['id']}/decide", {"choice": choice})
+            latencies["decide"].append(time.perf_counter() - decided)
+            wins[choice, result["won"]] += 1
+    finally:
+        writer.close()
+    return wins
+
+
+def percentile(values, q):
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1] if len(values) > 1 else values[0]
+
+
+async def run(args):
+    latencies = defaultdict(list)
+    start = time.perf_counter()
+    deadline = start + args.duration
+    results = await asyncio.gather(
+        *(play(args.host, args.port, deadline, latencies, args.doors) for _ in range(args.connections))
+    )
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{total:,} requests in {elapsed:.1f} s: {total / elapsed:,.0f} requests/s")
+    for name, values in latencies.items():
+        print(
+            f"{name:>9}: p50 {percentile(values, 50) * 1000:.2f} ms, "
+            f"p99 {percentile(values, 99) * 1000:.2f} ms ({len(values):,} requests)"
+        )
+    wins = defaultdict(int)
+    for result in results:
+        for key, count in result.items():
+            wins[key] += count
+    for choice in ("stay", "switch"):
+        games = wins[choice, True] + wins[choice, False]
+        if games:
+            print(f"{choice:>9}: won {wins[choice, True] / games:.1%} of {games:,} games")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--doors", type=int, default=3)
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measure how simulation throughput scales with worker processes.
+
+Runs the same sharded simulation with 1, 2, ... up to the number of cores and
+reports trials per second and the speedup over one worker:
+
+    python benchmarks/parallel.py --trials 200000000
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import simulation  # noqa: E402
+
+
+def measure(n_trials, workers, seed):
+    with ProcessPoolExecutor(workers) as pool:
+        # Start every worker before timing so process start-up is not counted
+        list(pool.map(simulation.count_wins, [1] * workers, range(workers)))
+        start = time.perf_counter()
+        for _ in simulation.simulate_parallel(n_trials, seed=seed, workers=workers, executor=pool):
+            pass
+        return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=100_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        elapsed = measure(args.trials, workers, args.seed)
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>3} workers: {elapsed:.2f} s, {args.trials / elapsed / 1e6:.1f} M trials/s, "
+            f"speedup {baseline / elapsed:.2f}x (ideal {workers}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Measure how long one door click takes to re-run on the server.
+
+Compares re-running the whole page (what every click used to cost) with
+re-running only the game panel fragment (what a click costs now):
+
+    python benchmarks/rerun.py --repeat 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+APP = os.path.join(ROOT, "montyhall.py")
+
+
+def _game_panel_only():
+    from panels import game_panel
+
+    game_panel()
+
+
+def _time_click(at):
+    at.button(key="door_0").click()
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def measure(make_app, repeat):
+    timings = []
+    for _ in range(repeat):
+        at = make_app().run()
+        timings.append(_time_click(at))
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    results = {
+        "full page": measure(lambda: AppTest.from_file(APP, default_timeout=30), args.repeat),
+        "game panel": measure(lambda: AppTest.from_function(_game_panel_only, default_timeout=30), args.repeat),
+    }
+    for name, timings in results.items():
+        print(f"{name:>12}: median {statistics.median(timings) * 1000:.2f} ms per click ({len(timings)} runs)")
+    speedup = statistics.median(results["full page"]) / statistics.median(results["game panel"])
+    print(f"{'speedup':>12}: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
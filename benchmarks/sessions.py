@@ -0,0 +1,66 @@
+"""Memory held per session and the cost of sweeping idle sessions.
+
+Creates ``--sessions`` sessions the way the game panel does (a seeded
+generator and a game that has been picked and revealed), measures the memory
+they hold with tracemalloc, then lets them all expire and times the sweep:
+
+    python benchmarks/sessions.py --sessions 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import MontyHallGame  # noqa: E402
+from seeding import make_rng  # noqa: E402
+from sessions import Session, SessionStore, overhead_size, state_size  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def new_session(seed):
+    rng = make_rng(seed)
+    game = MontyHallGame(rng=rng)
+    game.pick_door(seed % 3)
+    game.reveal()
+    return Session(seed, rng, game)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    clock = FakeClock()
+    store = SessionStore(ttl=60, sweep_interval=3600, clock=clock)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for seed in range(args.sessions):
+        store.add(new_session(seed))
+    total = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    print(f"{args.sessions:,} sessions hold {total / 1024:,.0f} KiB: {total / args.sessions:,.0f} bytes per session")
+    print(f"game state (record, game, door sets): {state_size(new_session(0)):,} bytes per session")
+    print(f"generator and store entry, as the app measures them: {overhead_size():,.0f} bytes per session")
+
+    clock.now += 61
+    start = time.perf_counter()
+    evicted = store.sweep()
+    elapsed = time.perf_counter() - start
+    print(f"swept {evicted:,} idle sessions in {elapsed * 1000:.1f} ms, {len(store):,} left")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
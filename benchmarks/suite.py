@@ -0,0 +1,208 @@
+"""Reproducible benchmark suite for the game and simulation hot paths.
+
+Measures:
+
+* game transitions per second (``select_door`` = pick + reveal, stay, switch)
+* full page rerun and door-click rerun time under Streamlit's ``AppTest``
+* simulation trials per second at several chunk sizes and worker counts
+
+and writes the results as JSON. Each result is compared against a stored
+baseline, and the exit code is 1 if anything regressed by more than
+``--tolerance``. ``--quick`` runs smaller simulations whose throughput isn't
+comparable with the full-size baseline, so quick runs are never compared and
+can't be saved as the baseline:
+
+    python benchmarks/suite.py                      # compare with baseline.json
+    python benchmarks/suite.py --save-baseline      # record a new baseline
+    python benchmarks/suite.py --quick              # smoke run, no comparison
+    python benchmarks/suite.py --profile --quick    # log rerun hotspots instead
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import numpy as np  # noqa: E402
+
+import simulation  # noqa: E402
+from game import MontyHallGame  # noqa: E402
+from seeding import make_rng  # noqa: E402
+
+BASELINE = os.path.join(HERE, "baseline.json")
+
+
+def result(value, unit, higher_is_better=True):
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+
+def bench_game_steps(min_seconds=0.2, repeat=7):
+    """Transitions per second on one game, best of ``repeat`` runs of ``min_seconds`` or more.
+
+    Picking (which clears the previous reveal), staying and switching can be
+    repeated on the same game, so the loop measures the transitions themselves
+    rather than allocating and touching a fresh game per call. Each run makes
+    enough calls to last ``min_seconds``, because a single stay or switch takes
+    well under a microsecond.
+    """
+    game = MontyHallGame(rng=make_rng(0))
+    game.pick_door(0)
+    game.reveal()
+
+    def select_door():
+        game.pick_door(0)
+        game.reveal()
+
+    results = {}
+    for name, step in (("game.select_door", select_door), ("game.stay", game.stay), ("game.switch", game.switch)):
+        timer = timeit.Timer(step)
+        number, elapsed = timer.autorange()
+        number = max(number, int(number * min_seconds / elapsed))
+        best = min(timer.repeat(repeat, number))
+        results[name] = result(number / best, "ops/s")
+    return results
+
+
+def bench_reruns(repeat):
+    from streamlit.testing.v1 import AppTest
+
+    import rerun
+
+    first = []
+    for _ in range(repeat):
+        at = AppTest.from_file(rerun.APP, default_timeout=60)
+        start = time.perf_counter()
+        at.run()
+        first.append(time.perf_counter() - start)
+    clicks = rerun.measure(lambda: AppTest.from_file(rerun.APP, default_timeout=60), repeat)
+    panel = rerun.measure(lambda: AppTest.from_function(rerun._game_panel_only, default_timeout=60), repeat)
+    return {
+        "rerun.full_page_ms": result(statistics.median(first) * 1000, "ms", False),
+        "rerun.door_click_ms": result(statistics.median(clicks) * 1000, "ms", False),
+        "rerun.game_panel_ms": result(statistics.median(panel) * 1000, "ms", False),
+    }
+
+
+def bench_chunk_sizes(n_trials, chunk_sizes):
+    results = {}
+    for chunk_size in chunk_sizes:
+        start = time.perf_counter()
+        simulation.simulate(n_trials, seed=0, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+        results[f"simulate.chunk_{chunk_size}"] = result(n_trials / elapsed, "trials/s")
+    return results
+
+
+def bench_workers(n_trials, worker_counts):
+    results = {}
+    for workers in worker_counts:
+        with ProcessPoolExecutor(workers) as pool:
+            list(pool.map(simulation.count_wins, [1] * workers, range(workers)))
+            start = time.perf_counter()
+            for _ in simulation.simulate_parallel(n_trials, 0, workers=workers, executor=pool):
+                pass
+            elapsed = time.perf_counter() - start
+        results[f"simulate_parallel.workers_{workers}"] = result(n_trials / elapsed, "trials/s")
+    return results
+
+
+def worker_counts(max_workers):
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def run(quick):
+    scale = 10 if quick else 1
+    results = {}
+    results.update(bench_game_steps())
+    results.update(bench_reruns(3 if quick else 10))
+    results.update(bench_chunk_sizes(20_000_000 // scale, [1 << 16, 1 << 18, 1 << 20, 1 << 22]))
+    results.update(bench_workers(100_000_000 // scale, worker_counts(os.cpu_count() or 1)))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print each result next to its baseline and return the names that regressed."""
+    regressions = []
+    for name, current in results.items():
+        line = f"{name:<36} {current['value']:>14,.2f} {current['unit']:<9}"
+        previous = baseline.get(name)
+        if previous:
+            change = current["value"] / previous["value"] - 1
+            worse = -change if current["higher_is_better"] else change
+            flag = "  REGRESSION" if worse > tolerance else ""
+            if flag:
+                regressions.append(name)
+            line += f" baseline {previous['value']:>14,.2f} ({change:+.1%}){flag}"
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument(
+        "--quick", action="store_true", help="smaller workloads for a fast smoke run (skips the comparison)"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="log cProfile/tracemalloc hotspots of every rerun (skips the comparison)"
+    )
+    args = parser.parse_args(argv)
+    if args.quick and args.save_baseline:
+        parser.error("--quick results can't be saved as the baseline")
+
+    if args.profile:
+        os.environ["MONTYHALL_PROFILE"] = "1"
+        logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "quick": args.quick,
+        },
+        "results": run(args.quick),
+    }
+
+    # Profiled timings include the profiler's own overhead and quick runs use
+    # smaller workloads, so neither is compared with the full-size baseline
+    baseline = {}
+    if os.path.exists(args.baseline) and not (args.save_baseline or args.profile or args.quick):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    regressions = compare(report["results"], baseline, args.tolerance)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
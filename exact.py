@@ -0,0 +1,81 @@
+"""Exact stay/switch win probabilities, without sampling.
+
+Games with ``N`` doors where the host opens ``K`` doors have closed forms for
+the knowing host and the ignorant "Monty Fall" host (conditioned on a goat
+being revealed). Any pair of three-door :mod:`policies` is solved exactly by
+walking the game tree: car, pick, the host's reveal, the player's decision.
+Results are memoized in bounded LRU caches keyed by the configuration.
+"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+
+# Configurations remembered by each cache
+CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class Odds:
+    """Chances of winning the car by staying or by switching to one closed door."""
+
+    stay: Fraction
+    switch: Fraction
+
+
+def describe(p):
+    """Format a probability like ``2/3 (67%)``."""
+    return f"{p.numerator}/{p.denominator} ({float(p):.0%})"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def exact_odds(n_doors=3, n_reveals=None, host="standard"):
+    """Exact :class:`Odds` for ``n_doors`` doors and ``n_reveals`` opened doors.
+
+    ``host`` is ``"standard"`` (Monty knows where the car is and only opens
+    goat doors) or ``"fall"`` (Monty opens doors at random; games where he
+    reveals the car are excluded). Switching means moving to one of the doors
+    still closed, chosen at random.
+    """
+    if n_doors < 3:
+        raise ValueError("a game needs at least 3 doors")
+    if n_reveals is None:
+        n_reveals = n_doors - 2
+    if not 0 <= n_reveals <= n_doors - 2:
+        raise ValueError(f"the host can open between 0 and {n_doors - 2} doors")
+
+    closed_others = n_doors - 1 - n_reveals
+    if host == "standard":
+        # Opening goats never moves the 1/N on the pick; the rest spreads over the closed doors
+        return Odds(Fraction(1, n_doors), Fraction(n_doors - 1, n_doors * closed_others))
+    if host == "fall":
+        # Seeing only goats is equally likely to leave the car behind any closed door
+        return Odds(Fraction(1, n_doors - n_reveals), Fraction(1, n_doors - n_reveals))
+    raise ValueError(f"unknown host {host!r}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def exact_win_rate(host, player):
+    """Exact win probability of ``player`` against ``host`` in three-door games.
+
+    Games where the host reveals the car are excluded, as in
+    :func:`policies.evaluate`.
+    """
+    wins = Fraction(0)
+    valid = Fraction(0)
+    for car in range(3):
+        for pick in range(3):
+            for opened, q in host.reveal_probabilities(car, pick).items():
+                if opened == car:
+                    continue
+                p = Fraction(1, 9) * q
+                valid += p
+                for final, r in player.choice_probabilities(pick, opened).items():
+                    if final == car:
+                        wins += p * r
+    return wins / valid
+
+
+def exact_matrix(hosts, players):
+    """Exact win rates for every host and player pair, as nested lists."""
+    return [[exact_win_rate(host, player) for player in players] for host in hosts]
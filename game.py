@@ -0,0 +1,148 @@
+"""Game-state engine for Monty Hall games with any number of doors.
+
+A game stores the car index, the player's pick and the host's reveal as a set
+of door indices, so picking, revealing and switching never touch all ``N``
+doors. When the host opens most of the doors (the classic large-N demo opens
+``N - 2`` of them) the engine stores the few doors left closed instead, which
+keeps every move O(1) or O(K) for ``K`` reveals.
+"""
+
+from typing import Iterable, Optional
+
+from seeding import make_rng
+
+
+def _sample_doors(k: int, n_doors: int, exclude: Iterable[int], rng) -> set[int]:
+    """Draw ``k`` distinct doors from ``range(n_doors)`` minus ``exclude``.
+
+    Uses Floyd's algorithm, so the cost is O(k) regardless of ``n_doors``.
+    """
+    skip = sorted(set(exclude))
+    m = n_doors - len(skip)
+    chosen = set()
+    for j in range(m - k, m):
+        t = int(rng.integers(j + 1))
+        chosen.add(j if t in chosen else t)
+
+    doors = set()
+    for index in chosen:
+        for s in skip:
+            if index >= s:
+                index += 1
+        doors.add(index)
+    return doors
+
+
+class MontyHallGame:
+    """One round of Monty Hall with ``n_doors`` doors and ``n_reveals`` host reveals.
+
+    ``n_reveals`` defaults to ``n_doors - 2``: the host opens every door except
+    the player's pick and one other, as in the three-door show. ``rng`` is a
+    ``numpy.random.Generator``; pass a seeded one to make the game replayable.
+    """
+
+    __slots__ = ("n_doors", "n_reveals", "car", "pick", "final", "_opened", "_kept", "_rng")
+
+    n_doors: int
+    n_reveals: int
+    car: int
+    pick: Optional[int]
+    final: Optional[int]
+
+    def __init__(self, n_doors: int = 3, n_reveals: Optional[int] = None, rng=None, car: Optional[int] = None):
+        if n_doors < 3:
+            raise ValueError("a game needs at least 3 doors")
+        if n_reveals is None:
+            n_reveals = n_doors - 2
+        if not 0 <= n_reveals <= n_doors - 2:
+            raise ValueError(f"the host can open between 0 and {n_doors - 2} doors")
+
+        self._rng = rng if rng is not None else make_rng()
+        self.n_doors = n_doors
+        self.n_reveals = n_reveals
+        self.car = int(self._rng.integers(n_doors)) if car is None else self._check_door(car)
+        self.pick = None
+        self.final = None
+        self._opened: Optional[set[int]] = None
+        self._kept: Optional[set[int]] = None
+
+    def _check_door(self, door: int) -> int:
+        if not 0 <= door < self.n_doors:
+            raise ValueError(f"door must be between 0 and {self.n_doors - 1}")
+        return door
+
+    @property
+    def revealed(self) -> bool:
+        """True once the host has opened doors for the current pick."""
+        return self._opened is not None or self._kept is not None
+
+    @property
+    def won(self) -> Optional[bool]:
+        """Whether the final choice hides the car, or ``None`` before the decision."""
+        return None if self.final is None else self.final == self.car
+
+    @property
+    def switch_door(self) -> Optional[int]:
+        """The only other closed door when the host leaves exactly one."""
+        if self._kept is None or len(self._kept) != 1:
+            return None
+        return next(iter(self._kept))
+
+    def pick_door(self, door: int) -> None:
+        """Make the first pick, clearing any previous reveal and decision."""
+        self.pick = self._check_door(door)
+        self.final = None
+        self._opened = None
+        self._kept = None
+
+    def reveal(self) -> None:
+        """Have the host open ``n_reveals`` goat doors other than the pick."""
+        if self.pick is None:
+            raise ValueError("pick a door before the host reveals")
+
+        # Doors other than the pick that stay closed after the reveal
+        n_kept = self.n_doors - 1 - self.n_reveals
+        if n_kept <= self.n_reveals:
+            if self.car != self.pick:
+                kept = _sample_doors(n_kept - 1, self.n_doors, (self.pick, self.car), self._rng)
+                kept.add(self.car)
+            else:
+                kept = _sample_doors(n_kept, self.n_doors, (self.pick,), self._rng)
+            self._kept = kept
+        else:
+            self._opened = _sample_doors(self.n_reveals, self.n_doors, (self.pick, self.car), self._rng)
+
+    def is_open(self, door: int) -> bool:
+        """Whether the host has opened ``door``."""
+        if not self.revealed or door == self.pick:
+            return False
+        if self._kept is not None:
+            return door not in self._kept
+        return door in self._opened
+
+    def opened_doors(self) -> list[int]:
+        """The doors the host opened, only practical to list for small games."""
+        if not self.revealed:
+            return []
+        return [door for door in range(self.n_doors) if self.is_open(door)]
+
+    def stay(self) -> None:
+        if not self.revealed:
+            raise ValueError("the host has not revealed yet")
+        self.final = self.pick
+
+    def switch(self, door: Optional[int] = None) -> None:
+        """Switch to ``door``, or to the single remaining closed door."""
+        if not self.revealed:
+            raise ValueError("the host has not revealed yet")
+        if door is None:
+            door = self.switch_door
+            if door is None:
+                raise ValueError("more than one closed door left; choose which one to switch to")
+        elif door == self.pick or self.is_open(self._check_door(door)):
+            raise ValueError("you can only switch to another closed door")
+        self.final = door
+
+    def place_car(self, door: int) -> None:
+        """Move the car behind ``door``."""
+        self.car = self._check_door(door)
@@ -0,0 +1,168 @@
+"""Append-only on-disk log of every completed game.
+
+Rounds are queued in memory and written by a background thread in batched
+transactions to a SQLite database in WAL mode, so recording a game never waits
+on disk I/O. Each batch also updates a small per-decision aggregates table in
+the same transaction, which lets the global stay/switch win rates be read in
+constant time however many games have been logged. A batch that can't be
+written (say the database is locked by another process for longer than
+SQLite's busy timeout) is logged to the ``montyhall.game_log`` logger and
+dropped, and the writer carries on with the next one.
+"""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+DEFAULT_PATH = os.environ.get(
+    "MONTYHALL_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "games.sqlite3")
+)
+
+# Most rounds written per transaction
+BATCH_SIZE = 1000
+
+logger = logging.getLogger("montyhall.game_log")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    n_doors INTEGER NOT NULL,
+    car INTEGER NOT NULL,
+    pick INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    switched INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    opened INTEGER  -- the door opened in three-door games; NULL for larger ones and older rows
+);
+CREATE TABLE IF NOT EXISTS totals (
+    switched INTEGER PRIMARY KEY,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL
+);
+"""
+
+INSERT_GAME = """
+INSERT INTO games (played_at, n_doors, car, pick, final, switched, won, opened) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+UPDATE_TOTALS = """
+INSERT INTO totals (switched, games, wins) VALUES (?, ?, ?)
+ON CONFLICT (switched) DO UPDATE SET games = games + excluded.games, wins = wins + excluded.wins
+"""
+
+
+@dataclass(frozen=True)
+class GlobalStats:
+    stay_games: int = 0
+    stay_wins: int = 0
+    switch_games: int = 0
+    switch_wins: int = 0
+
+    @property
+    def stay_rate(self):
+        return self.stay_wins / self.stay_games if self.stay_games else 0.0
+
+    @property
+    def switch_rate(self):
+        return self.switch_wins / self.switch_games if self.switch_games else 0.0
+
+
+def connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def create_schema(conn):
+    """Create the tables, adding the ``opened`` column to logs written before it existed."""
+    conn.executescript(SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+    if "opened" not in columns:
+        conn.execute("ALTER TABLE games ADD COLUMN opened INTEGER")
+
+
+class GameLog:
+    """Process-wide game log with a background batch writer."""
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        conn = connect(path)
+        create_schema(conn)
+        conn.close()
+        self._reader = connect(path)
+        self._reader_lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, name="game-log-writer", daemon=True)
+        self._writer.start()
+
+    def record(self, game):
+        """Queue a finished :class:`~game.MontyHallGame`; returns immediately."""
+        opened = game.opened_doors()[0] if game.n_doors == 3 and game.n_reveals == 1 else None
+        switched = int(game.final != game.pick)
+        self._queue.put((time.time(), game.n_doors, game.car, game.pick, game.final, switched, int(game.won), opened))
+
+    def flush(self):
+        """Block until every round queued so far has been written (or failed to be)."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+        self._reader.close()
+
+    def stats(self):
+        """Global stay and switch results, read from the aggregates table."""
+        with self._reader_lock:
+            rows = self._reader.execute("SELECT switched, games, wins FROM totals").fetchall()
+        totals = {switched: (games, wins) for switched, games, wins in rows}
+        stay_games, stay_wins = totals.get(0, (0, 0))
+        switch_games, switch_wins = totals.get(1, (0, 0))
+        return GlobalStats(stay_games, stay_wins, switch_games, switch_wins)
+
+    def _write_loop(self):
+        conn = connect(self.path)
+        running = True
+        while running:
+            batch = []
+            waiters = []
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if not running or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    self._write(conn, batch)
+            except Exception:
+                logger.exception("could not write %d games to %s", len(batch), self.path)
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+        conn.close()
+
+    @staticmethod
+    def _write(conn, batch):
+        totals = {}
+        for row in batch:
+            games, wins = totals.get(row[5], (0, 0))
+            totals[row[5]] = (games + 1, wins + row[6])
+        with conn:
+            conn.executemany(INSERT_GAME, batch)
+            conn.executemany(UPDATE_TOTALS, [(switched, games, wins) for switched, (games, wins) in totals.items()])
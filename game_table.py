@@ -0,0 +1,61 @@
+"""In-memory table of live games with idle-time (TTL) eviction."""
+
+import itertools
+import time
+from collections import OrderedDict
+
+
+class GameTable:
+    """Maps integer ids to games, evicting those idle for longer than ``ttl`` seconds.
+
+    Entries are kept in least-recently-used order, so eviction only ever looks
+    at the oldest entries and every operation is amortised O(1).
+    """
+
+    def __init__(self, ttl=600.0, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._ids = itertools.count(1)
+        self._games = OrderedDict()
+
+    def __len__(self):
+        return len(self._games)
+
+    def add(self, game):
+        """Store ``game`` and return its new id."""
+        self.evict()
+        game_id = next(self._ids)
+        self._games[game_id] = (game, self._clock())
+        return game_id
+
+    def get(self, game_id):
+        """The game for ``game_id``, marking it as used, or ``None`` if unknown or expired."""
+        entry = self._games.get(game_id)
+        if entry is None:
+            return None
+        now = self._clock()
+        if now - entry[1] > self.ttl:
+            del self._games[game_id]
+            return None
+        self._games[game_id] = (entry[0], now)
+        self._games.move_to_end(game_id)
+        return entry[0]
+
+    def games(self):
+        """The live games, least recently used first."""
+        return [game for game, _ in self._games.values()]
+
+    def remove(self, game_id):
+        self._games.pop(game_id, None)
+
+    def evict(self):
+        """Drop every game idle for longer than ``ttl``; return how many were dropped."""
+        deadline = self._clock() - self.ttl
+        evicted = 0
+        while self._games:
+            game_id, (_, last_used) = next(iter(self._games.items()))
+            if last_used >= deadline:
+                break
+            del self._games[game_id]
+            evicted += 1
+        return evicted
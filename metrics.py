@@ -0,0 +1,207 @@
+"""Process-wide counters, gauges and histograms in Prometheus text format.
+
+The app and the headless API record door picks, stay/switch decisions and
+their outcomes, restarts, rerun times, live and evicted sessions with their
+size, and simulation throughput here. Recording an event is a dict update
+under a lock (about a microsecond). :func:`render` formats every metric for a
+Prometheus scrape; :func:`serve` exposes it at ``/metrics`` on a local port,
+and the API serves it on its own port.
+"""
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds (seconds) of the rerun time buckets
+RERUN_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds (games per second) of the simulation throughput buckets
+THROUGHPUT_BUCKETS = (1e5, 1e6, 5e6, 1e7, 2.5e7, 5e7, 1e8, 2.5e8, 1e9)
+
+
+def _format_labels(names, values, extra=""):
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def samples(self):
+        """``(suffix, label string, value)`` for every series of this metric."""
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(f"{self.name}{suffix}{labels} {value!r}" for suffix, labels, value in self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """A count that only goes up, one series per tuple of label values."""
+
+    kind = "counter"
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels=()):
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [("", _format_labels(self.labels, labels), value) for labels, value in items]
+
+
+class Gauge(Metric):
+    """A value read from ``function`` whenever the metrics are rendered."""
+
+    kind = "gauge"
+
+    def __init__(self, name, help, function=None):
+        super().__init__(name, help)
+        self.function = function
+
+    def samples(self):
+        return [] if self.function is None else [("", "", self.function())]
+
+
+class Histogram(Metric):
+    """Counts of observations per bucket, with their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=RERUN_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, labels=()):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                # One count per bucket plus +Inf, then the sum
+                series = self._values[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, labels=()):
+        """Observe how many seconds the enclosed block takes."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, labels)
+
+    def samples(self):
+        with self._lock:
+            items = [(labels, list(series)) for labels, series in self._values.items()]
+        samples = []
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                samples.append(("_bucket", _format_labels(self.labels, labels, f'le="{le}"'), cumulative))
+            samples.append(("_sum", _format_labels(self.labels, labels), series[-1]))
+            samples.append(("_count", _format_labels(self.labels, labels), cumulative))
+        return samples
+
+
+class Registry:
+    """Named metrics; registering a name again returns the existing metric."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = Registry()
+
+RERUN_SECONDS = REGISTRY.register(
+    Histogram("montyhall_rerun_seconds", "Time to rerun the page or one of its panels.", ("panel",))
+)
+DOOR_PICKS = REGISTRY.register(Counter("montyhall_door_picks_total", "Doors picked (the host reveals after each)."))
+DECISIONS = REGISTRY.register(
+    Counter("montyhall_decisions_total", "Stay/switch decisions by outcome, before any override.", ("choice", "outcome"))
+)
+RESTARTS = REGISTRY.register(Counter("montyhall_restarts_total", "Games restarted with the Restart button."))
+ACTIVE_SESSIONS = REGISTRY.register(Gauge("montyhall_active_sessions", "Sessions with game state on this server."))
+SESSIONS_EVICTED = REGISTRY.register(
+    Counter("montyhall_sessions_evicted_total", "Sessions dropped after being idle for longer than the TTL.")
+)
+SESSION_BYTES = REGISTRY.register(
+    Gauge("montyhall_session_bytes", "Average memory per live session at the last sweep, generator included.")
+)
+SESSION_GAME_STATE_BYTES = REGISTRY.register(
+    Gauge(
+        "montyhall_session_game_state_bytes",
+        "Average bytes of session record and game per live session at the last sweep, excluding its generator.",
+    )
+)
+SIMULATED_GAMES = REGISTRY.register(Counter("montyhall_simulated_games_total", "Games played by simulations."))
+SIMULATION_THROUGHPUT = REGISTRY.register(
+    Histogram(
+        "montyhall_simulation_games_per_second", "Games per second of each simulation run.", buckets=THROUGHPUT_BUCKETS
+    )
+)
+
+
+def record_decision(game, choice):
+    """Count a finished game's ``"stay"`` or ``"switch"`` decision and its outcome."""
+    DECISIONS.inc((choice, "win" if game.won else "loss"))
+
+
+def render():
+    """Every metric of this process in Prometheus text format."""
+    return REGISTRY.render()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port, host="127.0.0.1"):
+    """Serve ``/metrics`` on ``host:port`` from a daemon thread; returns the server."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
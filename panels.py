@@ -0,0 +1,525 @@
+"""Interactive panels of the Monty Hall page.
+
+Each panel is a Streamlit fragment: clicking a door, a STAY/SWITCH button or
+the simulation controls re-runs only that panel instead of the whole page.
+"""
+
+import functools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+
+import pandas as pd
+import streamlit as st
+
+import metrics
+import policies
+import simulation
+from assets import LOSS_EXPLANATION_TEMPLATE, WIN_EXPLANATION_TEMPLATE
+from exact import describe, exact_matrix, exact_odds
+from game import MontyHallGame
+from game_log import GameLog
+from profiling import profiled
+from seeding import make_rng, new_seed
+from sessions import Session, SessionStore
+from tournament import Tournament
+
+# Number of doors in the interactive game
+N_DOORS = 3
+
+# Simulations above this many games are sharded across the worker pool
+IN_PROCESS_TRIALS = 10_000_000
+
+# Seconds between live updates while a simulation runs
+PROGRESS_INTERVAL = 0.2
+
+# Most points kept on the convergence chart
+MAX_CHART_POINTS = 200
+
+# How often the global stats panel refreshes itself when live updates are on
+STATS_REFRESH = "10s"
+
+# How often the tournament panel refreshes the round and leaderboard for
+# sessions that have joined
+TOURNAMENT_REFRESH = "3s"
+
+# Players shown on the tournament leaderboard
+LEADERBOARD_SIZE = 10
+
+# Local port serving /metrics; unset to not serve them
+METRICS_PORT = os.environ.get("MONTYHALL_METRICS_PORT")
+
+
+@st.cache_resource
+def game_log():
+    """The game log shared by every session in this process."""
+    return GameLog()
+
+
+@st.cache_resource
+def metrics_server():
+    """The /metrics endpoint of this process, if ``MONTYHALL_METRICS_PORT`` is set."""
+    return metrics.serve(int(METRICS_PORT)) if METRICS_PORT else None
+
+
+@st.cache_resource
+def session_store():
+    """Game state of every session in this process, evicted when idle."""
+    store = SessionStore()
+    metrics.ACTIVE_SESSIONS.function = store.__len__
+    metrics.SESSION_BYTES.function = lambda: store.session_bytes
+    metrics.SESSION_GAME_STATE_BYTES.function = lambda: store.state_bytes
+    return store
+
+
+def current_session():
+    """This browser session's state, started afresh (seeded from ``?seed=``) if new or evicted."""
+    store = session_store()
+    session = store.get(st.session_state.get("session_id"))
+    if session is None:
+        seed = st.query_params.get("seed")
+        seed = int(seed) if seed and seed.isdigit() else new_seed()
+        rng = make_rng(seed)
+        session = Session(seed, rng, MontyHallGame(N_DOORS, rng=rng))
+        st.session_state.session_id = store.add(session)
+    return session
+
+
+@functools.lru_cache(maxsize=2)
+def explanation_html(won):
+    """The stay/switch explanation boxes, filled in with the exact odds."""
+    odds = exact_odds(N_DOORS)
+    template = WIN_EXPLANATION_TEMPLATE if won else LOSS_EXPLANATION_TEMPLATE
+    return template.format(stay=describe(odds.stay), switch=describe(odds.switch), others=describe(1 - odds.stay))
+
+
+def restart_game():
+    session = current_session()
+    session.game = MontyHallGame(N_DOORS, rng=session.rng)
+    metrics.RESTARTS.inc()
+
+
+def decide(game, choice):
+    """Apply a STAY or SWITCH click; games that are already decided are left alone."""
+    if game.final is not None:
+        return
+    remaining_door = game.switch_door
+    if choice == "stay":
+        game.stay()
+    else:
+        game.switch()
+    # Log the honest outcome before the demonstration override below
+    game_log().record(game)
+    metrics.record_decision(game, choice)
+    # Always put the car behind the other door (for demonstration purposes)
+    game.place_car(remaining_door)
+
+
+@st.fragment
+@profiled
+def game_panel():
+    # Game area
+    session = current_session()
+    game = session.game
+
+    # Door selection area
+    st.markdown("<h3 style='color: #2c3e50;'>🚪 Choose a Door</h3>", unsafe_allow_html=True)
+    
+    # Door display with buttons as the doors themselves
+    cols = st.columns(N_DOORS)
+    
+    def select_door(door):
+        game.pick_door(door)
+        game.reveal()
+        metrics.DOOR_PICKS.inc()
+    
+    # Custom door buttons
+    for i, col in enumerate(cols):
+        door_class = ""
+        door_icon = "🚪"
+        door_label = f"Door {i + 1}"
+        is_disabled = False
+        
+        if game.pick is not None:
+            if i == game.pick:
+                door_label = f"Door {i + 1} (Your choice)"
+                door_class = "door-chosen"
+                is_disabled = True
+            elif game.is_open(i):
+                door_label = f"Door {i + 1} (Goat revealed)"
+                door_class = "door-revealed"
+                door_icon = "🐐"
+                is_disabled = True
+            else:
+                is_disabled = True
+        
+        # Add a special CSS class to the column for door styling
+        col.markdown(f'<div class="door-button-container {door_class}">', unsafe_allow_html=True)
+        
+        # The button itself is now the door
+        # Create a button with door_icon in span for separate styling
+        button_text = f"{door_label}"
+        col.markdown(f'<div style="text-align: center; padding: 0 10px;"><span style="font-size: 150px; line-height: 1.2;">{door_icon}</span></div>', unsafe_allow_html=True)
+        col.button(
+            button_text,
+            key=f"door_{i}",
+            on_click=select_door if not is_disabled else None,
+            args=(i,) if not is_disabled else None,
+            disabled=is_disabled,
+            use_container_width=True
+        )
+        
+        col.markdown('</div>', unsafe_allow_html=True)
+    
+    # Show host reveal and decision section
+    if game.revealed:
+        revealed_door = game.opened_doors()[0]
+        st.markdown(f"""
+            <div class="result-animation" style="background-color: #fff3cd; padding: 15px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #ffc107;">
+                <h4 style="color: #856404;">🐐 The host reveals a goat behind Door {revealed_door + 1}!</h4>
+                <p>Now comes the critical decision...</p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        # The decision buttons only exist until the game is decided
+        if game.final is None:
+            # Create a nicer decision box
+            st.markdown("""
+                <div style="background-color: #e8f4f8; padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #3498db;">
+                    <h4 style="color: #2980b9;">🤔 Do you want to switch your choice?</h4>
+                </div>
+            """, unsafe_allow_html=True)
+
+            # Better radio buttons for decision
+            cols = st.columns(2)
+            with cols[0]:
+                st.button(
+                    f"STAY with Door {game.pick + 1}", 
+                    on_click=decide,
+                    args=(game, "stay"),
+                    use_container_width=True,
+                    type="primary"
+                )
+
+            with cols[1]:
+                st.button(
+                    f"SWITCH to Door {game.switch_door + 1}", 
+                    on_click=decide,
+                    args=(game, "switch"),
+                    use_container_width=True,
+                    type="secondary"
+                )
+    
+    # Display the final result
+    if game.final is not None:
+        final_choice = game.final
+        prize = '🚗' if game.won else '🐐'
+        
+        # Fancy result display
+        st.markdown("""
+            <div class="result-animation" style="background-color: #f0f7ff; padding: 25px; border-radius: 10px; margin: 30px 0; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.1);">
+                <h3 style="color: #3498db; margin-bottom: 20px;">🎉 Final Result</h3>
+                <p style="font-size: 18px; margin-bottom: 15px;">You chose <b>Door {}</b>...</p>
+                <div style="font-size: 60px; margin: 20px 0;">{}</div>
+            </div>
+        """.format(final_choice + 1, prize), unsafe_allow_html=True)
+        
+        if game.won:
+            st.success("🏆 **Congratulations!** You won the **car**! 🚗")
+            st.markdown(explanation_html(True), unsafe_allow_html=True)
+        else:
+            st.error("🐐 **Oh no!** You got a **goat**! Better luck next time!")
+            st.markdown(explanation_html(False), unsafe_allow_html=True)
+        
+        # Play again button with better styling
+        st.button("🔄 Restart Game", on_click=restart_game, use_container_width=True, type="primary")
+        st.caption(f"🎲 Session seed {session.seed}: open the page with `?seed={session.seed}` to replay these games.")
+
+
+@st.cache_resource
+def simulation_pool():
+    """Worker processes shared by the large simulations of every session."""
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+
+def simulate_with_chart(n_trials, seed, n_doors):
+    """Run a simulation while charting how the stay and switch rates converge.
+
+    Large runs are sharded across the worker pool. The chart keeps at most
+    ``MAX_CHART_POINTS`` points and is redrawn at most every
+    ``PROGRESS_INTERVAL`` seconds, so memory and the payload sent to the
+    browser stay bounded however many games are played.
+    """
+    tracker = simulation.ConvergenceTracker(n_trials, MAX_CHART_POINTS, seed=seed)
+    if n_trials <= IN_PROCESS_TRIALS:
+        batches = simulation.simulate_batches(n_trials, seed, n_doors, split_at=tracker.checkpoints)
+    else:
+        batches = simulation.simulate_parallel(n_trials, seed, n_doors, executor=simulation_pool())
+
+    progress = st.progress(0.0, text="Starting...")
+    chart = st.empty()
+    points = []
+    last_update = 0.0
+    # Leaving the loop early (Stop button, another click) closes the run and
+    # cancels its queued shards
+    with closing(batches):
+        for batch in batches:
+            point = tracker.add(*batch)
+            if point is not None:
+                points.append(point)
+            if time.perf_counter() - last_update >= PROGRESS_INTERVAL:
+                progress.progress(tracker.trials / n_trials, text=f"{tracker.trials:,} of {n_trials:,} games played")
+                draw_convergence(chart, points)
+                # Count the interval from the end of the redraw, so a slow draw
+                # can't leave the loop doing nothing but redraw
+                last_update = time.perf_counter()
+    progress.empty()
+    draw_convergence(chart, points)
+    return tracker.result()
+
+
+CONVERGENCE_COLUMNS = [
+    "Games played", "Stay", "Switch", "Stay 95% low", "Stay 95% high", "Switch 95% low", "Switch 95% high"
+]
+
+
+def draw_convergence(placeholder, points):
+    """Chart the stay and switch rates, each between the bounds of its 95% Wilson interval."""
+    frame = pd.DataFrame(points, columns=CONVERGENCE_COLUMNS).set_index("Games played")
+    placeholder.line_chart(
+        frame,
+        x_label="Games played",
+        y_label="Win rate",
+        color=["#f44336", "#03a9f4", "#f9a19a", "#f9a19a", "#81d4fa", "#81d4fa"],
+    )
+
+
+@st.fragment
+@profiled
+def simulation_panel():
+    st.markdown("Play thousands (or millions) of games at once and compare how often staying and switching win.")
+
+    sim_cols = st.columns([1, 1, 1], gap="large")
+    with sim_cols[0]:
+        n_trials = st.number_input(
+            "Number of games",
+            min_value=1_000,
+            max_value=1_000_000_000,
+            value=1_000_000,
+            step=1_000_000,
+        )
+        n_doors = st.number_input("Number of doors", min_value=3, max_value=1_000_000, value=N_DOORS)
+        seed_text = st.text_input("Seed (optional)", placeholder="Leave blank for a random seed")
+        run_simulation = st.button("▶️ Run Simulation", use_container_width=True, type="primary")
+
+    if run_simulation:
+        start = time.perf_counter()
+        seed = int(seed_text) if seed_text.strip().isdigit() else None
+        sim = simulate_with_chart(int(n_trials), seed if seed is not None else new_seed(), int(n_doors))
+        elapsed = time.perf_counter() - start
+        metrics.SIMULATED_GAMES.inc(amount=sim.trials)
+        metrics.SIMULATION_THROUGHPUT.observe(sim.trials / elapsed)
+        stay_low, stay_high = sim.stay_interval()
+        switch_low, switch_high = sim.switch_interval()
+        with sim_cols[1]:
+            st.metric("🔒 Stay win rate", f"{sim.stay_rate:.2%}")
+            st.caption(f"95% CI: {stay_low:.3%} – {stay_high:.3%}")
+        with sim_cols[2]:
+            st.metric("🔄 Switch win rate", f"{sim.switch_rate:.2%}")
+            st.caption(f"95% CI: {switch_low:.3%} – {switch_high:.3%}")
+        odds = exact_odds(int(n_doors))
+        st.caption(
+            f"Simulated {sim.trials:,} games in {elapsed:.3f} seconds with seed {sim.seed}. "
+            f"Exact odds: stay {describe(odds.stay)}, switch {describe(odds.switch)}."
+        )
+
+
+
+@st.fragment
+@profiled
+def strategy_panel():
+    st.markdown("Change how the host picks a door to open and how the player decides, and see who wins how often.")
+
+    names = {
+        "index": [host.name for host in policies.HOSTS],
+        "columns": [player.name for player in policies.PLAYERS],
+    }
+    strategy_cols = st.columns([1, 2], gap="large")
+    with strategy_cols[0]:
+        n_trials = st.number_input(
+            "Games per host",
+            min_value=1_000,
+            max_value=100_000_000,
+            value=1_000_000,
+            step=1_000_000,
+            key="strategy_trials",
+        )
+        run_matrix = st.button("▶️ Compare Strategies", use_container_width=True, type="primary")
+
+    if run_matrix:
+        start = time.perf_counter()
+        matrix = policies.evaluate(policies.HOSTS, policies.PLAYERS, int(n_trials))
+        elapsed = time.perf_counter() - start
+        frame = pd.DataFrame(matrix.win_rates() * 100, **names)
+        with strategy_cols[1]:
+            st.dataframe(frame.style.format("{:.1f}%"), use_container_width=True)
+            st.caption(
+                f"Win rates over {matrix.trials:,} games per host in {elapsed:.2f} seconds (seed {matrix.seed}). "
+                "Games where the ignorant host reveals the car don't count."
+            )
+    else:
+        exact = exact_matrix(policies.HOSTS, policies.PLAYERS)
+        frame = pd.DataFrame([[describe(p) for p in row] for row in exact], **names)
+        with strategy_cols[1]:
+            st.dataframe(frame, use_container_width=True)
+            st.caption("Exact win rates. Run the comparison to check them against simulated games.")
+
+
+@st.cache_resource
+def shared_tournament():
+    """The tournament every session in this process plays in."""
+    return Tournament(N_DOORS)
+
+
+def tournament_action(action, *args):
+    """Run a tournament move from a button, keeping its error for the next rerun."""
+    try:
+        action(*args)
+    except ValueError as error:
+        st.session_state.tournament_error = str(error)
+
+
+def tournament_round(tournament, game_round, player):
+    st.markdown(f"**Round {game_round.number}**")
+    door = game_round.picks.get(player)
+    if door is None:
+        cols = st.columns(game_round.n_doors)
+        for i, col in enumerate(cols):
+            col.button(
+                f"🚪 Door {i + 1}",
+                key=f"tournament_door_{i}",
+                on_click=tournament_action,
+                args=(tournament.pick, player, i),
+                use_container_width=True,
+            )
+        return
+
+    group = game_round.group(door)
+    won = game_round.won(player)
+    if won is None:
+        st.markdown(f"You picked **Door {door + 1}** and the host opens **Door {group.opened_doors()[0] + 1}** 🐐")
+        cols = st.columns(2)
+        cols[0].button(
+            f"STAY with Door {door + 1}",
+            key="tournament_stay",
+            on_click=tournament_action,
+            args=(tournament.decide, player, "stay"),
+            use_container_width=True,
+            type="primary",
+        )
+        cols[1].button(
+            f"SWITCH to Door {group.switch_door + 1}",
+            key="tournament_switch",
+            on_click=tournament_action,
+            args=(tournament.decide, player, "switch"),
+            use_container_width=True,
+        )
+    else:
+        if won:
+            st.success(f"🚗 The car was behind Door {game_round.car + 1}. You won this round!")
+        else:
+            st.error(f"🐐 The car was behind Door {game_round.car + 1}. Better luck next round!")
+        for group_door, players, stay_wins in tournament.door_groups():
+            winner = "staying" if stay_wins else "switching"
+            st.markdown(f"Door {group_door + 1}: {players:,} players, {winner} won")
+    st.caption(f"Players in this round: {len(game_round.picks):,}, decided: {len(game_round.choices):,}.")
+
+
+def tournament_panel():
+    """The tournament section; only sessions that have joined poll for updates."""
+    st.markdown("Everyone plays the same deal. The host starts each round; pick a door, then stay or switch.")
+    # Not part of the fragments below: joining reruns the page once, which
+    # switches this session over to the polling view
+    name = st.text_input("Your name", key="tournament_name", max_chars=30).strip()
+    if name:
+        # Players are this server-side session, so nobody can play under someone else's entry
+        current_session()
+        player = st.session_state.session_id
+        shared_tournament().join(player, name)
+        live_tournament(player)
+    else:
+        idle_tournament()
+
+
+@st.fragment(run_every=TOURNAMENT_REFRESH)
+@profiled
+def live_tournament(player):
+    tournament_view(player)
+
+
+@st.fragment
+@profiled
+def idle_tournament():
+    tournament_view(None)
+
+
+def tournament_view(player):
+    tournament = shared_tournament()
+    tournament_cols = st.columns([1, 1.5], gap="large")
+    with tournament_cols[0]:
+        # Open the page with ?tournament=host to run the rounds
+        if st.query_params.get("tournament") == "host":
+            st.button("🏁 Start a New Round", on_click=tournament.start_round, use_container_width=True, type="primary")
+        if "tournament_error" in st.session_state:
+            st.warning(st.session_state.pop("tournament_error"))
+        game_round = tournament.round
+        if game_round is None:
+            st.info("Waiting for the host to start the first round.")
+        elif player is None:
+            st.info(f"Round {game_round.number} is on. Enter your name to play.")
+        else:
+            tournament_round(tournament, game_round, player)
+
+    with tournament_cols[1]:
+        standings = tournament.standings(LEADERBOARD_SIZE)
+        if standings:
+            frame = pd.DataFrame(standings, columns=["Player", "Wins", "Games"])
+            frame.index += 1
+            st.dataframe(frame, use_container_width=True)
+        else:
+            st.caption("The leaderboard fills up as players decide.")
+
+
+def global_stats_panel():
+    """The global stats section; it only polls the game log once live updates are on."""
+    st.markdown("How every player's games have really turned out, counted from the car's original position.")
+    # Not part of the fragments below, so switching it reruns the page once
+    if st.toggle("Live updates", key="stats_live", help=f"Refresh these numbers every {STATS_REFRESH}"):
+        live_global_stats()
+    else:
+        idle_global_stats()
+
+
+@st.fragment(run_every=STATS_REFRESH)
+@profiled
+def live_global_stats():
+    global_stats_view()
+
+
+@st.fragment
+@profiled
+def idle_global_stats():
+    global_stats_view()
+
+
+def global_stats_view():
+    stats = game_log().stats()
+    stat_cols = st.columns(2, gap="large")
+    with stat_cols[0]:
+        st.metric("🔒 Stay win rate", f"{stats.stay_rate:.2%}")
+        st.caption(f"{stats.stay_wins:,} wins in {stats.stay_games:,} games")
+    with stat_cols[1]:
+        st.metric("🔄 Switch win rate", f"{stats.switch_rate:.2%}")
+        st.caption(f"{stats.switch_wins:,} wins in {stats.switch_games:,} games")
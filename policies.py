@@ -0,0 +1,221 @@
+"""Host and player strategies for three-door games, evaluated in batch.
+
+A host policy decides which door Monty opens after the first pick; a player
+policy decides the final door once a door has been opened. Both work on whole
+arrays of games, so any pair can be scored over millions of trials with
+vectorized kernels:
+
+    matrix = policies.evaluate(policies.HOSTS, policies.PLAYERS, 10_000_000, seed=1)
+    matrix.win_rates()  # hosts x players
+
+Every player policy is scored on the same dealt games and reveals, so the
+differences between columns come from the strategies and not from noise.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from fractions import Fraction
+
+import numpy as np
+
+from seeding import make_rng, new_seed, spawn_seeds
+from simulation import CHUNK_SIZE, chunk_sizes
+
+
+HALF = Fraction(1, 2)
+
+
+def other_doors(pick):
+    """The lower- and higher-numbered doors the player did not pick."""
+    lower = (pick == 0).astype(np.uint8)
+    higher = 2 - (pick == 2).astype(np.uint8)
+    return lower, higher
+
+
+def other_door_pair(pick):
+    """:func:`other_doors` for a single game."""
+    return (1 if pick == 0 else 0), (1 if pick == 2 else 2)
+
+
+class HostPolicy(ABC):
+    """Chooses the door the host opens in each game."""
+
+    name = "host"
+
+    @abstractmethod
+    def reveal(self, car, pick, rng):
+        """Return the opened doors for arrays of car positions and picks."""
+
+    @abstractmethod
+    def reveal_probabilities(self, car, pick):
+        """``{opened door: probability}`` for a single game, used for exact odds."""
+
+
+class PlayerPolicy(ABC):
+    """Chooses the player's final door in each game."""
+
+    name = "player"
+
+    @abstractmethod
+    def choose(self, pick, opened, rng):
+        """Return the final doors for arrays of first picks and opened doors."""
+
+    @abstractmethod
+    def choice_probabilities(self, pick, opened):
+        """``{final door: probability}`` for a single game, used for exact odds."""
+
+
+class StandardHost(HostPolicy):
+    """Monty knows where the car is and opens a random goat door."""
+
+    name = "Standard Monty"
+
+    def reveal(self, car, pick, rng):
+        offset = rng.integers(1, 3, len(car), dtype=np.uint8)
+        return np.where(car == pick, (pick + offset) % 3, 3 - car - pick).astype(np.uint8)
+
+    def reveal_probabilities(self, car, pick):
+        if car != pick:
+            return {3 - car - pick: Fraction(1)}
+        lower, higher = other_door_pair(pick)
+        return {lower: HALF, higher: HALF}
+
+
+class BiasedHost(HostPolicy):
+    """Monty opens a goat door, preferring the lower-numbered one with probability ``p``
+    when both unpicked doors hide goats."""
+
+    def __init__(self, p=0.75, name=None):
+        self.p = p
+        self.name = name or f"Biased Monty ({p:.0%} low door)"
+
+    def reveal(self, car, pick, rng):
+        lower, higher = other_doors(pick)
+        preferred = np.where(rng.random(len(car)) < self.p, lower, higher)
+        return np.where(car == pick, preferred, 3 - car - pick).astype(np.uint8)
+
+    def reveal_probabilities(self, car, pick):
+        if car != pick:
+            return {3 - car - pick: Fraction(1)}
+        lower, higher = other_door_pair(pick)
+        p = Fraction(self.p).limit_denominator()
+        return {lower: p, higher: 1 - p}
+
+
+class MontyCrawl(BiasedHost):
+    """Monty always opens the lowest-numbered goat door he can."""
+
+    def __init__(self):
+        super().__init__(1.0, "Monty Crawl")
+
+    def reveal(self, car, pick, rng):
+        lower, _ = other_doors(pick)
+        return np.where(car == pick, lower, 3 - car - pick).astype(np.uint8)
+
+
+class MontyFall(HostPolicy):
+    """Monty doesn't know where the car is and opens either unpicked door at random.
+
+    Games where he reveals the car are void and left out of the win rates.
+    """
+
+    name = "Monty Fall (ignorant)"
+
+    def reveal(self, car, pick, rng):
+        offset = rng.integers(1, 3, len(car), dtype=np.uint8)
+        return ((pick + offset) % 3).astype(np.uint8)
+
+    def reveal_probabilities(self, car, pick):
+        lower, higher = other_door_pair(pick)
+        return {lower: HALF, higher: HALF}
+
+
+class Stay(PlayerPolicy):
+    name = "Always stay"
+
+    def choose(self, pick, opened, rng):
+        return pick
+
+    def choice_probabilities(self, pick, opened):
+        return {pick: Fraction(1)}
+
+
+class Switch(PlayerPolicy):
+    name = "Always switch"
+
+    def choose(self, pick, opened, rng):
+        return 3 - pick - opened
+
+    def choice_probabilities(self, pick, opened):
+        return {3 - pick - opened: Fraction(1)}
+
+
+class CoinFlip(PlayerPolicy):
+    name = "Coin flip"
+
+    def choose(self, pick, opened, rng):
+        return np.where(rng.random(len(pick)) < 0.5, pick, 3 - pick - opened)
+
+    def choice_probabilities(self, pick, opened):
+        return {pick: HALF, 3 - pick - opened: HALF}
+
+
+class CrawlAware(PlayerPolicy):
+    """Switches only when the host skipped the lower-numbered unpicked door.
+
+    Against Monty Crawl that skip means the car is certainly behind it.
+    """
+
+    name = "Switch if low door skipped"
+
+    def choose(self, pick, opened, rng):
+        lower, _ = other_doors(pick)
+        return np.where(opened == lower, pick, 3 - pick - opened)
+
+    def choice_probabilities(self, pick, opened):
+        lower, _ = other_door_pair(pick)
+        return {pick if opened == lower else 3 - pick - opened: Fraction(1)}
+
+
+HOSTS = (StandardHost(), MontyFall(), BiasedHost(), MontyCrawl())
+PLAYERS = (Stay(), Switch(), CoinFlip(), CrawlAware())
+
+
+@dataclass(frozen=True)
+class PolicyMatrix:
+    hosts: tuple
+    players: tuple
+    trials: int
+    valid: np.ndarray  # games per host where the host revealed a goat
+    wins: np.ndarray  # hosts x players
+    seed: int
+
+    def win_rates(self):
+        return self.wins / np.maximum(self.valid, 1)[:, None]
+
+
+def evaluate(hosts, players, n_trials, seed=None, chunk_size=CHUNK_SIZE):
+    """Play ``n_trials`` games per host policy and score every player policy on them."""
+    if n_trials < 0:
+        raise ValueError("n_trials must be non-negative")
+    if seed is None:
+        seed = new_seed()
+
+    valid = np.zeros(len(hosts), dtype=np.int64)
+    wins = np.zeros((len(hosts), len(players)), dtype=np.int64)
+    sizes = chunk_sizes(n_trials, chunk_size)
+    for n, chunk_seed in zip(sizes, spawn_seeds(seed, len(sizes))):
+        # Every host sees the same deals within a chunk
+        deal_seed, *policy_seeds = chunk_seed.spawn(1 + len(hosts))
+        deal_rng = make_rng(deal_seed)
+        car = deal_rng.integers(0, 3, n, dtype=np.uint8)
+        pick = deal_rng.integers(0, 3, n, dtype=np.uint8)
+        for h, (host, policy_seed) in enumerate(zip(hosts, policy_seeds)):
+            rng = make_rng(policy_seed)
+            opened = host.reveal(car, pick, rng)
+            goat = opened != car
+            valid[h] += np.count_nonzero(goat)
+            for p, player in enumerate(players):
+                final = player.choose(pick, opened, rng)
+                wins[h, p] += np.count_nonzero((final == car) & goat)
+    return PolicyMatrix(tuple(hosts), tuple(players), n_trials, valid, wins, seed)
@@ -0,0 +1,107 @@
+"""Timing and opt-in profiling of page and fragment reruns.
+
+Every rerun's duration is recorded in the ``montyhall_rerun_seconds``
+histogram of :mod:`metrics`. Set ``MONTYHALL_PROFILE=1`` to also run every
+rerun under cProfile and tracemalloc and log its top time and allocation
+hotspots to the ``montyhall.profile`` logger. ``MONTYHALL_PROFILE_TOP`` sets
+how many entries are reported (default 10). tracemalloc is process-wide, so
+only one rerun is profiled at a time; reruns that overlap it, including the
+fragments of a profiled page, are only timed. Other code that measures
+memory with tracemalloc goes through :func:`traced` to share it safely.
+"""
+
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from metrics import RERUN_SECONDS
+
+ENABLED = os.environ.get("MONTYHALL_PROFILE", "") not in ("", "0")
+TOP = int(os.environ.get("MONTYHALL_PROFILE_TOP", "10"))
+
+logger = logging.getLogger("montyhall.profile")
+_profiling = threading.Lock()
+_profiling_thread = None  # thread id of the rerun being profiled
+
+
+def report(name, elapsed, profiler, snapshot, top=TOP):
+    """Format the hotspots of one profiled rerun."""
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(top)
+    lines = [f"{name} rerun took {elapsed * 1000:.2f} ms", "Top time hotspots:", stream.getvalue().strip()]
+    lines.append("Top allocation sites:")
+    for stat in snapshot.statistics("lineno")[:top]:
+        lines.append(f"  {stat.size / 1024:8.1f} KiB in {stat.count:6d} blocks  {stat.traceback}")
+    return "\n".join(lines)
+
+
+@contextmanager
+def profile_rerun(name, enabled=None):
+    """Time the enclosed block, and profile it if profiling is on and no other block is being profiled."""
+    if not (ENABLED if enabled is None else enabled) or not _profiling.acquire(blocking=False):
+        with RERUN_SECONDS.time((name,)):
+            yield
+        return
+
+    global _profiling_thread
+    _profiling_thread = threading.get_ident()
+    try:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            RERUN_SECONDS.observe(elapsed, (name,))
+            logger.warning(report(name, elapsed, profiler, snapshot))
+    finally:
+        _profiling_thread = None
+        _profiling.release()
+
+
+@contextmanager
+def traced():
+    """Trace allocations in the enclosed block without upsetting a profiled rerun.
+
+    tracemalloc is process-wide, so the block waits for any rerun being
+    profiled on another thread, and runs under the tracing of the rerun being
+    profiled on this one.
+    """
+    if _profiling_thread == threading.get_ident():
+        yield
+        return
+    with _profiling:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            yield
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+
+def profiled(func):
+    """Decorator form of :func:`profile_rerun`, for fragments."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with profile_rerun(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,28 @@
+"""Seeded, independent random streams.
+
+Every session and every simulation batch draws from its own
+``numpy.random.Generator`` instead of the process-wide ``random`` module, so
+games and simulations can be replayed from their seed and never share RNG
+state with other sessions.
+"""
+
+import numpy as np
+
+
+def new_seed():
+    """A fresh seed drawn from OS entropy."""
+    return np.random.SeedSequence().entropy
+
+
+def make_rng(seed=None):
+    """A PCG64 generator for ``seed`` (an int or a ``SeedSequence``)."""
+    return np.random.Generator(np.random.PCG64(seed))
+
+
+def spawn_seeds(seed, n):
+    """``n`` independent child seed sequences of ``seed``.
+
+    Child ``i`` is always the same for a given seed, so work split into shards
+    gives the same result however the shards are scheduled.
+    """
+    return np.random.SeedSequence(seed).spawn(n)
@@ -0,0 +1,133 @@
+"""Server-side game state of the Streamlit sessions, with idle-time eviction.
+
+Each browser session keeps only its integer session id in ``st.session_state``;
+its seed, random generator and current game live in a process-wide
+:class:`SessionStore`. A background thread sweeps the store every
+``sweep_interval`` seconds and drops sessions idle for longer than the TTL
+(``MONTYHALL_SESSION_TTL``, 30 minutes by default), so tabs left open or
+abandoned don't hold memory forever. A session that comes back after being
+evicted starts a new game. Each sweep counts its evictions in
+``montyhall_sessions_evicted_total`` and records the average memory per live
+session: :attr:`SessionStore.state_bytes` for the record and game alone, and
+:attr:`SessionStore.session_bytes` including the session's random generator
+and its entry in the store.
+"""
+
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+import metrics
+from game import MontyHallGame
+from game_table import GameTable
+from profiling import traced
+from seeding import make_rng, new_seed
+
+SESSION_TTL = float(os.environ.get("MONTYHALL_SESSION_TTL", "1800"))
+
+# Seconds between sweeps of idle sessions
+SWEEP_INTERVAL = 60.0
+
+logger = logging.getLogger("montyhall.sessions")
+
+
+class Session:
+    """One browser session: its seed, its random generator and its current game."""
+
+    __slots__ = ("seed", "rng", "game")
+
+    def __init__(self, seed, rng, game):
+        self.seed = seed
+        self.rng = rng
+        self.game = game
+
+
+def state_size(session):
+    """Bytes held by a session's record and game, not counting its random generator."""
+    game = session.game
+    size = sys.getsizeof(session) + sys.getsizeof(session.seed) + sys.getsizeof(game)
+    for name in game.__slots__:
+        value = getattr(game, name)
+        if isinstance(value, set):
+            size += sys.getsizeof(value)
+    return size
+
+
+@functools.cache
+def overhead_size(samples=256):
+    """Bytes a stored session holds beyond :func:`state_size`, measured once.
+
+    ``sys.getsizeof`` can't see a generator's native state, so this many
+    sessions are built like the app's and stored in a scratch table under
+    tracemalloc; the average difference from :func:`state_size` is the cost
+    of the generator and the table entry.
+    """
+    table = GameTable()
+    with traced():
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(samples):
+            seed = new_seed()
+            rng = make_rng(seed)
+            game = MontyHallGame(rng=rng)
+            game.pick_door(0)
+            game.reveal()
+            table.add(Session(seed, rng, game))
+        total = tracemalloc.get_traced_memory()[0] - before
+    return max(total / samples - sum(map(state_size, table.games())) / samples, 0.0)
+
+
+class SessionStore:
+    """Thread-safe table of live sessions, evicting those idle for longer than ``ttl`` seconds."""
+
+    def __init__(self, ttl=SESSION_TTL, sweep_interval=SWEEP_INTERVAL, clock=time.monotonic):
+        self._table = GameTable(ttl, clock)
+        self._lock = threading.Lock()
+        # Average bytes per live session at the last sweep, without and with
+        # its generator and store entry
+        self.state_bytes = 0.0
+        self.session_bytes = 0.0
+        self._stop = threading.Event()
+        self._sweeper = threading.Thread(
+            target=self._sweep_loop, args=(sweep_interval,), name="session-sweeper", daemon=True
+        )
+        self._sweeper.start()
+
+    def __len__(self):
+        return len(self._table)
+
+    def add(self, session):
+        """Store ``session`` and return its new id."""
+        with self._lock:
+            return self._table.add(session)
+
+    def get(self, session_id):
+        """The session for ``session_id``, marking it as used, or ``None`` if unknown or evicted."""
+        with self._lock:
+            return self._table.get(session_id)
+
+    def sweep(self):
+        """Evict idle sessions and record how many are left and their size; return how many were evicted."""
+        with self._lock:
+            evicted = self._table.evict()
+            sessions = self._table.games()
+        metrics.SESSIONS_EVICTED.inc(amount=evicted)
+        self.state_bytes = sum(map(state_size, sessions)) / max(len(sessions), 1)
+        self.session_bytes = self.state_bytes + overhead_size() if sessions else 0.0
+        if evicted or sessions:
+            logger.info(
+                "evicted %d idle sessions, %d live, %.0f bytes each (%.0f of game state)",
+                evicted, len(sessions), self.session_bytes, self.state_bytes,
+            )
+        return evicted
+
+    def close(self):
+        self._stop.set()
+        self._sweeper.join()
+
+    def _sweep_loop(self, interval):
+        while not self._stop.wait(interval):
+            self.sweep()
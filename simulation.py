@@ -0,0 +1,258 @@
+"""Vectorized Monte Carlo engine for the Monty Hall game.
+
+Every trial is played with whole-array NumPy operations: car positions, first
+picks, host reveals and stay/switch outcomes are computed per chunk with no
+per-trial Python loop. Very large runs can be sharded across a process pool
+with :func:`simulate_parallel`, which streams each shard's counts as it
+finishes; :class:`RunningStats` and :class:`ConvergenceTracker` fold those
+batches into running estimates.
+"""
+
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from seeding import make_rng, new_seed, spawn_seeds
+
+# Two-sided 95% normal quantile used for the default confidence intervals
+Z_95 = 1.959963984540054
+
+# Trials per chunk; keeps the working set small enough to stay in cache
+CHUNK_SIZE = 1 << 20
+
+
+def wilson_interval(wins, trials, z=Z_95):
+    """Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = wins / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    trials: int
+    stay_wins: int
+    switch_wins: int
+    seed: Optional[int] = None
+
+    @property
+    def stay_rate(self):
+        return self.stay_wins / self.trials if self.trials else 0.0
+
+    @property
+    def switch_rate(self):
+        return self.switch_wins / self.trials if self.trials else 0.0
+
+    def stay_interval(self, z=Z_95):
+        return wilson_interval(self.stay_wins, self.trials, z)
+
+    def switch_interval(self, z=Z_95):
+        return wilson_interval(self.switch_wins, self.trials, z)
+
+
+class RunningStats:
+    """Running stay/switch win counts, updated in O(1) per batch."""
+
+    __slots__ = ("trials", "stay_wins", "switch_wins", "seed")
+
+    def __init__(self, seed=None):
+        self.trials = 0
+        self.stay_wins = 0
+        self.switch_wins = 0
+        self.seed = seed
+
+    def add(self, trials, stay_wins, switch_wins):
+        self.trials += trials
+        self.stay_wins += stay_wins
+        self.switch_wins += switch_wins
+
+    def result(self):
+        return SimulationResult(self.trials, self.stay_wins, self.switch_wins, self.seed)
+
+
+class ConvergenceTracker(RunningStats):
+    """Running counts that emit a bounded number of points for a live chart.
+
+    Points are due at ``max_points`` geometrically spaced trial counts between
+    ``first`` and ``n_trials``, so early batches (where the rates still move)
+    get as much detail as the long tail, and the history never holds more than
+    ``max_points`` rows however many trials are run. Each point carries the
+    Wilson interval of both rates, so the chart shows how far they can still
+    move as well as where they are.
+    """
+
+    __slots__ = ("checkpoints", "_next")
+
+    def __init__(self, n_trials, max_points=200, first=100, seed=None):
+        super().__init__(seed)
+        self.checkpoints = checkpoints(n_trials, max_points, first)
+        self._next = 0
+
+    def add(self, trials, stay_wins, switch_wins):
+        """Add a batch; return a point when one is due.
+
+        A point is ``(trials, stay_rate, switch_rate, stay_low, stay_high,
+        switch_low, switch_high)``, the last four being the bounds of the 95%
+        Wilson interval of each rate.
+        """
+        super().add(trials, stay_wins, switch_wins)
+        due = self.checkpoints
+        if self._next >= len(due) or self.trials < due[self._next]:
+            return None
+        # Skip every checkpoint this batch jumped over, so one batch gives one point
+        while self._next < len(due) and due[self._next] <= self.trials:
+            self._next += 1
+        return (
+            self.trials,
+            self.stay_wins / self.trials,
+            self.switch_wins / self.trials,
+            *wilson_interval(self.stay_wins, self.trials),
+            *wilson_interval(self.switch_wins, self.trials),
+        )
+
+
+def checkpoints(n_trials, max_points, first=100):
+    """Up to ``max_points`` geometrically spaced trial counts ending at ``n_trials``."""
+    if n_trials <= 0:
+        return np.empty(0, dtype=np.int64)
+    first = min(first, n_trials)
+    return np.unique(np.geomspace(first, n_trials, max_points).round().astype(np.int64))
+
+
+def door_dtype(n_doors):
+    """Smallest unsigned dtype that holds the sum of two door indices."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if 2 * (n_doors - 1) <= np.iinfo(dtype).max:
+            return dtype
+    return np.uint64
+
+
+def play_trials(n, rng, n_doors=3):
+    """Play ``n`` games with ``n_doors`` doors at once.
+
+    The host opens every door except the pick and one other. Returns
+    ``(car, pick, switch)`` arrays, where ``switch`` is the door the host left
+    closed, i.e. the door a switching player ends up with.
+    """
+    dtype = door_dtype(n_doors)
+    car = rng.integers(0, n_doors, n, dtype=dtype)
+    pick = rng.integers(0, n_doors, n, dtype=dtype)
+    # When the first pick hides the car the host keeps a random goat door closed,
+    # otherwise the host has to keep the car closed
+    offset = rng.integers(1, n_doors, n, dtype=dtype)
+    switch = np.where(car == pick, (pick + offset) % n_doors, car).astype(dtype)
+    return car, pick, switch
+
+
+def revealed_door(pick, switch):
+    """The door the host opened in three-door games."""
+    return 3 - pick - switch
+
+
+def count_wins(n, seed, n_doors=3, splits=None):
+    """Play ``n`` games from ``seed`` and return ``(stay_wins, switch_wins)``.
+
+    With ``splits`` (sorted offsets inside the batch) the counts are returned as
+    arrays, one entry per segment between consecutive splits.
+    """
+    car, pick, switch = play_trials(n, make_rng(seed), n_doors)
+    stay = pick == car
+    switched = switch == car
+    if splits is None:
+        return int(np.count_nonzero(stay)), int(np.count_nonzero(switched))
+    starts = np.concatenate(([0], splits)).astype(np.intp)
+    return np.add.reduceat(stay, starts, dtype=np.int64), np.add.reduceat(switched, starts, dtype=np.int64)
+
+
+def chunk_sizes(n_trials, chunk_size=CHUNK_SIZE):
+    """Split ``n_trials`` into chunks of at most ``chunk_size`` trials."""
+    full, rest = divmod(n_trials, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def simulate_batches(n_trials, seed, n_doors=3, chunk_size=CHUNK_SIZE, split_at=()):
+    """Play ``n_trials`` games in process, yielding ``(trials, stay_wins, switch_wins)`` per batch.
+
+    Batches are the seeded chunks of :func:`simulate`, further split wherever
+    the running trial count reaches a value in ``split_at``.
+    """
+    split_at = np.asarray(split_at, dtype=np.int64)
+    sizes = chunk_sizes(n_trials, chunk_size)
+    start = 0
+    for n, chunk_seed in zip(sizes, spawn_seeds(seed, len(sizes))):
+        splits = split_at[(split_at > start) & (split_at < start + n)] - start
+        if not len(splits):
+            yield (n,) + count_wins(n, chunk_seed, n_doors)
+        else:
+            stay, switch = count_wins(n, chunk_seed, n_doors, splits)
+            for size, s, w in zip(np.diff(splits, prepend=0, append=n), stay, switch):
+                yield int(size), int(s), int(w)
+        start += n
+
+
+def simulate(n_trials, seed=None, n_doors=3, chunk_size=CHUNK_SIZE):
+    """Run ``n_trials`` stay and switch games and count the wins of each strategy.
+
+    Each chunk of ``chunk_size`` trials draws from its own stream spawned from
+    ``seed``, so the same seed and chunk size always give the same counts. A
+    fresh seed is drawn when none is given; it is recorded on the result.
+    """
+    if n_trials < 0:
+        raise ValueError("n_trials must be non-negative")
+    if seed is None:
+        seed = new_seed()
+
+    stats = RunningStats(seed)
+    for batch in simulate_batches(n_trials, seed, n_doors, chunk_size):
+        stats.add(*batch)
+    return stats.result()
+
+
+def simulate_parallel(n_trials, seed, n_doors=3, chunk_size=CHUNK_SIZE, workers=None, executor=None):
+    """Shard ``n_trials`` games across processes, yielding ``(trials, stay_wins, switch_wins)`` per shard.
+
+    Shards are yielded as they finish; summed (e.g. with :class:`RunningStats`)
+    they match :func:`simulate` for the same seed and chunk size. Pass a shared
+    ``executor`` to reuse its worker processes, otherwise a pool is started
+    for this run; ``workers`` (default: one per core) sizes that pool. At most
+    two shards per worker are queued at a time, so closing the generator
+    cancels the rest of the run and frees the workers as soon as their
+    current shard is done.
+    """
+    if n_trials < 0:
+        raise ValueError("n_trials must be non-negative")
+
+    workers = workers or os.cpu_count() or 1
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(workers)
+
+    sizes = chunk_sizes(n_trials, chunk_size)
+    shards = iter(zip(sizes, spawn_seeds(seed, len(sizes))))
+    pending = {}
+    try:
+        for n, shard_seed in shards:
+            pending[executor.submit(count_wins, n, shard_seed, n_doors)] = n
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                n = pending.pop(future)
+                shard = next(shards, None)
+                if shard is not None:
+                    pending[executor.submit(count_wins, shard[0], shard[1], n_doors)] = shard[0]
+                yield (n,) + future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+from api import MAX_DOORS, GameServer
+
+
+@pytest.fixture
+def server():
+    return GameServer(seed=0)
+
+
+def post(server, path, data=None):
+    return server.dispatch("POST", path, json.dumps(data).encode() if data is not None else b"")
+
+
+def new_game(server, **data):
+    status, state = post(server, "/games", data)
+    assert status == 201
+    return state["id"]
+
+
+def test_a_game_plays_through(server):
+    game_id = new_game(server)
+    status, state = post(server, f"/games/{game_id}/pick", {"door": 1})
+    assert status == 200
+    assert state["pick"] == 1 and len(state["opened"]) == 1
+    status, state = post(server, f"/games/{game_id}/decide", {"choice": "switch"})
+    assert status == 200
+    assert state["final"] == state["switch_door"]
+    assert state["won"] == (state["final"] == state["car"])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"doors": 5, "reveals": 1.5},
+        {"doors": 3.7},
+        {"doors": "3"},
+        {"doors": True},
+        {"doors": 1e400},
+        {"doors": 2},
+        {"doors": MAX_DOORS + 1},
+        {"doors": 5, "reveals": 4},
+        {"doors": 100_000, "reveals": 50_000},
+    ],
+)
+def test_bad_games_are_refused(server, data):
+    status, payload = post(server, "/games", data)
+    assert status == 400
+    assert "error" in payload
+    assert len(server.table) == 0
+
+
+def test_huge_numbers_are_refused():
+    server = GameServer(seed=0)
+    assert server.dispatch("POST", "/games", b'{"doors": 1e400}')[0] == 400
+    assert server.dispatch("POST", "/games", b'{"doors": ' + b"9" * 5000 + b"}")[0] == 400
+
+
+@pytest.mark.parametrize("data", [{}, {"door": 1.0}, {"door": 0.5}, {"door": "1"}, {"door": 3}, {"door": -1}])
+def test_bad_picks_leave_the_game_untouched(server, data):
+    game_id = new_game(server)
+    status, _ = post(server, f"/games/{game_id}/pick", data)
+    assert status == 400
+    _, state = server.dispatch("GET", f"/games/{game_id}", b"")
+    assert state["pick"] is None and "opened" not in state
+    assert post(server, f"/games/{game_id}/pick", {"door": 2})[0] == 200
+
+
+@pytest.mark.parametrize(
+    "body, error",
+    [(b"[1, 2]", "expected a JSON object"), (b"{not json", None), (b'{"choice": "maybe"}', "choice must")],
+)
+def test_bad_decisions_are_refused(server, body, error):
+    game_id = new_game(server)
+    post(server, f"/games/{game_id}/pick", {"door": 0})
+    status, payload = server.dispatch("POST", f"/games/{game_id}/decide", body)
+    assert status == 400
+    assert error is None or payload["error"].startswith(error)
+
+
+def test_decide_before_pick_is_refused(server):
+    game_id = new_game(server)
+    assert post(server, f"/games/{game_id}/decide", {"choice": "stay"})[0] == 400
+
+
+@pytest.mark.parametrize("path", ["/nope", "/games/123", "/games/abc/pick", "/games/1/pick/again"])
+def test_unknown_paths_and_games_are_not_found(server, path):
+    new_game(server)
+    assert server.dispatch("GET", path, b"")[0] == 404
+
+
+def test_unknown_action_is_not_found(server):
+    game_id = new_game(server)
+    assert post(server, f"/games/{game_id}/peek", {})[0] == 404
+
+
+@pytest.mark.parametrize("method, path", [("GET", "/games"), ("DELETE", "/games"), ("PUT", "/games/{id}/pick")])
+def test_wrong_methods_are_not_allowed(server, method, path):
+    game_id = new_game(server)
+    assert server.dispatch(method, path.format(id=game_id), b"")[0] == 405
+
+
+def test_repeat_picks_and_decisions_conflict(server):
+    game_id = new_game(server)
+    assert post(server, f"/games/{game_id}/pick", {"door": 0})[0] == 200
+    assert post(server, f"/games/{game_id}/pick", {"door": 1})[0] == 409
+    assert post(server, f"/games/{game_id}/decide", {"choice": "stay"})[0] == 200
+    status, payload = post(server, f"/games/{game_id}/decide", {"choice": "switch"})
+    assert status == 409
+    assert payload["error"] == "this game has already been decided"
+    assert post(server, f"/games/{game_id}/pick", {"door": 2})[0] == 409
+    _, state = server.dispatch("GET", f"/games/{game_id}", b"")
+    assert state["pick"] == 0 and state["final"] == 0
+
+
+def test_metrics_are_served_as_text(server):
+    status, payload = server.dispatch("GET", "/metrics", b"")
+    assert status == 200
+    assert "montyhall_door_picks_total" in payload
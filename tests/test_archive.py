@@ -0,0 +1,101 @@
+import itertools
+import sqlite3
+
+import numpy as np
+import pytest
+
+import archive
+import simulation
+from game import MontyHallGame
+from game_log import GameLog
+from seeding import make_rng
+
+
+def test_unpack_round_trips_pack():
+    fields = np.array(list(itertools.product(range(3), range(3), range(4), range(2), range(2))), dtype=np.uint8).T
+    records = archive.pack(*fields)
+    assert records.dtype == np.uint8
+    assert len(np.unique(records)) == fields.shape[1]
+    for unpacked, original in zip(archive.unpack(records), fields):
+        np.testing.assert_array_equal(unpacked, original)
+
+
+def test_replay_of_a_simulation_matches_simulate(tmp_path):
+    path = str(tmp_path / "runs.npy")
+    archive.export_simulation(path, 100_000, seed=3, chunk_size=1 << 14)
+    summary = archive.replay(path, chunk_size=10_000)
+    expected = simulation.simulate(100_000, seed=3, chunk_size=1 << 14)
+    assert summary.result() == simulation.SimulationResult(expected.trials, expected.stay_wins, expected.switch_wins)
+    assert summary.void == 0
+    assert summary.config == {
+        "n_doors": 3, "host": "Standard Monty", "player": "Coin flip", "seed": 3, "source": "simulation"
+    }
+    games = [games for games, _ in summary.decisions().values()]
+    assert sum(games) == 100_000
+
+
+def test_replay_leaves_out_games_where_the_host_revealed_the_car(tmp_path):
+    path = str(tmp_path / "fall.npy")
+    archive.export_simulation(path, 30_000, seed=4, host=archive.HOST_CHOICES["fall"])
+    car, _, reveal, _, won = archive.unpack(np.load(path))
+    summary = archive.replay(path)
+    assert summary.void == np.count_nonzero(reveal == car) > 0
+    assert summary.trials + summary.void == 30_000
+    assert not won[reveal == car].any()
+    assert summary.result().stay_rate == pytest.approx(0.5, abs=0.02)
+
+
+def test_export_log_skips_and_counts_games_with_more_doors(tmp_path):
+    db = str(tmp_path / "games.sqlite3")
+    log = GameLog(db)
+    rng = make_rng(5)
+    for i in range(12):
+        game = MontyHallGame(3 if i % 4 else 4, rng=rng)
+        game.pick_door(0)
+        game.reveal()
+        game.switch() if i % 2 else game.stay()
+        log.record(game)
+    log.close()
+
+    path = str(tmp_path / "games.npy")
+    assert archive.export_log(path, db) == (9, 3)
+    assert archive.read_config(path)["skipped_games"] == 3
+    car, pick, reveal, switched, won = archive.unpack(np.load(path))
+    with sqlite3.connect(db) as conn:
+        query = "SELECT car, pick, final, switched, won FROM games WHERE n_doors = 3 ORDER BY id"
+        rows = np.array(conn.execute(query).fetchall())
+    np.testing.assert_array_equal(car, rows[:, 0])
+    np.testing.assert_array_equal(switched, rows[:, 3])
+    np.testing.assert_array_equal(won, rows[:, 4])
+    # Every game has its real reveal, including stays on the car
+    assert (reveal != archive.REVEAL_UNKNOWN).all()
+    assert not (reveal == pick).any()
+    assert not (reveal == car).any()
+    assert not (reveal == rows[:, 2]).any()
+
+
+def test_export_log_recovers_reveals_of_rows_logged_before_the_opened_column(tmp_path):
+    db = str(tmp_path / "games.sqlite3")
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            "CREATE TABLE games (id INTEGER PRIMARY KEY, played_at REAL NOT NULL, n_doors INTEGER NOT NULL,"
+            " car INTEGER NOT NULL, pick INTEGER NOT NULL, final INTEGER NOT NULL,"
+            " switched INTEGER NOT NULL, won INTEGER NOT NULL)"
+        )
+        # (car, pick, final, switched, won): a switch, a stay on a goat and a stay on the car
+        rows = [(0, 1, 0, 1, 1), (2, 0, 0, 0, 0), (1, 1, 1, 0, 1)]
+        conn.executemany("INSERT INTO games VALUES (NULL, 0, 3, ?, ?, ?, ?, ?)", rows)
+    conn.close()
+
+    log = GameLog(db)
+    game = MontyHallGame(rng=make_rng(6), car=0)
+    game.pick_door(0)
+    game.reveal()
+    game.stay()
+    log.record(game)
+    log.close()
+
+    path = str(tmp_path / "games.npy")
+    assert archive.export_log(path, db) == (4, 0)
+    _, _, reveal, _, _ = archive.unpack(np.load(path))
+    assert reveal.tolist() == [2, 1, archive.REVEAL_UNKNOWN, game.opened_doors()[0]]
@@ -0,0 +1,30 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import policies
+from exact import exact_matrix, exact_odds
+
+
+def test_three_door_odds():
+    assert exact_odds(3) == exact_odds(3, 1, "standard")
+    assert (exact_odds(3).stay, exact_odds(3).switch) == (Fraction(1, 3), Fraction(2, 3))
+    assert (exact_odds(3, host="fall").stay, exact_odds(3, host="fall").switch) == (Fraction(1, 2), Fraction(1, 2))
+
+
+@pytest.mark.parametrize("n_doors, n_reveals", [(3, 1), (10, 8), (10, 3), (100, 0)])
+def test_odds_sum_over_closed_doors_to_one(n_doors, n_reveals):
+    odds = exact_odds(n_doors, n_reveals)
+    assert odds.stay + odds.switch * (n_doors - 1 - n_reveals) == 1
+
+
+def test_exact_matrix_matches_evaluate():
+    exact = np.array(exact_matrix(policies.HOSTS, policies.PLAYERS), dtype=float)
+    simulated = policies.evaluate(policies.HOSTS, policies.PLAYERS, 400_000, seed=1).win_rates()
+    assert np.abs(simulated - exact).max() < 0.005
+
+
+def test_unknown_host_is_rejected():
+    with pytest.raises(ValueError):
+        exact_odds(3, host="psychic")
@@ -0,0 +1,78 @@
+from collections import Counter
+
+import pytest
+
+from game import MontyHallGame, _sample_doors
+from seeding import make_rng
+
+
+@pytest.mark.parametrize("k, n_doors, exclude", [(0, 5, {1}), (3, 10, {2, 5}), (8, 10, {0, 9}), (2, 4, {3, 0})])
+def test_sample_doors_draws_distinct_doors_outside_exclude(k, n_doors, exclude):
+    rng = make_rng(0)
+    for _ in range(200):
+        doors = _sample_doors(k, n_doors, exclude, rng)
+        assert len(doors) == k
+        assert doors <= set(range(n_doors)) - exclude
+
+
+def test_sample_doors_is_uniform_over_remaining_doors():
+    rng = make_rng(1)
+    counts = Counter(door for _ in range(6000) for door in _sample_doors(1, 5, (0, 3), rng))
+    assert set(counts) == {1, 2, 4}
+    assert all(1800 < count < 2200 for count in counts.values())
+
+
+# (n_doors, n_reveals, branch): the host keeps the few doors left closed when
+# it opens at least as many as it leaves, and the opened doors otherwise
+REVEALS = [(3, 1, "kept"), (10, 8, "kept"), (10, 5, "kept"), (10, 2, "opened"), (6, 0, "opened"), (100, 3, "opened")]
+
+
+@pytest.mark.parametrize("n_doors, n_reveals, branch", REVEALS)
+def test_reveal_never_opens_pick_or_car(n_doors, n_reveals, branch):
+    rng = make_rng(2)
+    for pick in range(n_doors):
+        for _ in range(20):
+            game = MontyHallGame(n_doors, n_reveals, rng=rng)
+            game.pick_door(pick)
+            game.reveal()
+            assert (game._kept if branch == "kept" else game._opened) is not None
+            opened = game.opened_doors()
+            assert len(opened) == n_reveals
+            assert game.pick not in opened
+            assert game.car not in opened
+
+
+@pytest.mark.parametrize("n_doors", [3, 4, 50, 1_000_000])
+def test_switch_door_is_the_car_whenever_the_pick_is_not(n_doors):
+    rng = make_rng(3)
+    for _ in range(300):
+        game = MontyHallGame(n_doors, rng=rng)
+        game.pick_door(int(rng.integers(n_doors)))
+        game.reveal()
+        if game.pick != game.car:
+            assert game.switch_door == game.car
+        else:
+            assert game.switch_door != game.pick
+            assert not game.is_open(game.switch_door)
+
+
+def test_switch_door_is_unset_when_several_doors_stay_closed():
+    game = MontyHallGame(5, 1, rng=make_rng(4))
+    game.pick_door(0)
+    game.reveal()
+    assert game.switch_door is None
+    with pytest.raises(ValueError):
+        game.switch()
+
+
+def test_decisions_need_a_reveal():
+    game = MontyHallGame(rng=make_rng(5))
+    with pytest.raises(ValueError):
+        game.reveal()
+    game.pick_door(1)
+    with pytest.raises(ValueError):
+        game.stay()
+    game.reveal()
+    game.switch()
+    assert game.final == game.switch_door
+    assert game.won == (game.final == game.car)
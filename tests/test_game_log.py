@@ -0,0 +1,79 @@
+import sqlite3
+
+import pytest
+
+from game import MontyHallGame
+from game_log import GameLog
+from seeding import make_rng
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = GameLog(str(tmp_path / "games.sqlite3"), batch_size=7)
+    yield log
+    log.close()
+
+
+def play(rng, switch):
+    game = MontyHallGame(rng=rng)
+    game.pick_door(int(rng.integers(3)))
+    game.reveal()
+    game.switch() if switch else game.stay()
+    return game
+
+
+def test_flush_writes_every_queued_game_across_batches(log):
+    rng = make_rng(0)
+    games = [play(rng, switch=i % 3 == 0) for i in range(50)]
+    for game in games:
+        log.record(game)
+    log.flush()
+
+    with sqlite3.connect(log.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM games").fetchone() == (50,)
+    switched = [game for game in games if game.final != game.pick]
+    stayed = [game for game in games if game.final == game.pick]
+    stats = log.stats()
+    assert (stats.switch_games, stats.switch_wins) == (len(switched), sum(game.won for game in switched))
+    assert (stats.stay_games, stats.stay_wins) == (len(stayed), sum(game.won for game in stayed))
+
+
+def test_totals_persist_across_logs(tmp_path):
+    path = str(tmp_path / "games.sqlite3")
+    rng = make_rng(1)
+    for _ in range(2):
+        log = GameLog(path)
+        for _ in range(5):
+            log.record(play(rng, switch=True))
+        log.close()
+    log = GameLog(path)
+    assert log.stats().switch_games == 10
+    log.close()
+
+
+def test_flush_with_nothing_queued_returns(log):
+    log.flush()
+    assert log.stats().stay_games == log.stats().switch_games == 0
+
+
+def test_a_failed_write_is_logged_and_the_writer_carries_on(log, monkeypatch, caplog):
+    write = log._write
+    failures = []
+
+    def locked_once(conn, batch):
+        if not failures:
+            failures.append(len(batch))
+            raise sqlite3.OperationalError("database is locked")
+        write(conn, batch)
+
+    monkeypatch.setattr(log, "_write", locked_once)
+    rng = make_rng(2)
+    log.record(play(rng, switch=False))
+    log.flush()
+    assert failures == [1]
+    assert "could not write 1 games" in caplog.text
+
+    for _ in range(3):
+        log.record(play(rng, switch=False))
+    log.flush()
+    assert log.stats().stay_games == 3
@@ -0,0 +1,94 @@
+import pytest
+
+from seeding import make_rng
+from tournament import Leaderboard, Round, Tournament
+
+
+def test_group_outcomes_match_the_car():
+    for seed in range(20):
+        game_round = Round(1, 3, make_rng(seed))
+        for door in range(3):
+            game = game_round.group(door)
+            assert game.car == game_round.car
+            assert game.pick == door
+            assert game_round.car not in game.opened_doors()
+            player = f"p{door}"
+            game_round.pick(player, door)
+            assert game_round.decide(player, "stay") == (door == game_round.car)
+            assert game_round.won(player) == (door == game_round.car)
+
+
+def test_players_share_their_door_group():
+    game_round = Round(1, 3, make_rng(1))
+    first = game_round.pick("ada", 0)
+    assert game_round.pick("bob", 0) is first
+    assert game_round.decide("ada", "switch") == game_round.decide("bob", "switch") == (game_round.car != 0)
+
+
+@pytest.mark.parametrize("n_doors", [3, 10])
+def test_switching_wins_exactly_when_the_pick_is_not_the_car(n_doors):
+    for seed in range(20):
+        game_round = Round(1, n_doors, make_rng(seed))
+        for door in range(n_doors):
+            game_round.pick(door, door)
+            assert game_round.decide(door, "switch") == (door != game_round.car)
+
+
+def test_repicking_before_deciding_moves_the_player():
+    game_round = Round(1, 3, make_rng(2))
+    game_round.pick("ada", 0)
+    game_round.pick("bob", 0)
+    game_round.pick("ada", 2)
+    assert game_round.picks["ada"] == 2
+    assert game_round.door_groups() == [(0, 1, game_round.car == 0), (2, 1, game_round.car == 2)]
+    assert game_round.decide("ada", "stay") == (game_round.car == 2)
+
+
+def test_decisions_are_final():
+    game_round = Round(1, 3, make_rng(3))
+    with pytest.raises(ValueError, match="pick a door first"):
+        game_round.decide("ada", "stay")
+    game_round.pick("ada", 1)
+    with pytest.raises(ValueError, match="choice must be"):
+        game_round.decide("ada", "maybe")
+    game_round.decide("ada", "stay")
+    with pytest.raises(ValueError, match="already decided"):
+        game_round.decide("ada", "switch")
+    with pytest.raises(ValueError, match="already decided"):
+        game_round.pick("ada", 2)
+
+
+def test_leaderboard_stays_sorted_as_results_arrive():
+    board = Leaderboard()
+    results = [("a", 1), ("b", 0), ("c", 1), ("b", 1), ("a", 0), ("b", 1), ("c", 1), ("d", 0)]
+    for player, won in results:
+        board.record(player, won)
+    # Most wins first, then fewest games, then player
+    assert board.top() == [("c", 2, 2), ("b", 2, 3), ("a", 1, 2), ("d", 0, 1)]
+    assert board.top(2) == [("c", 2, 2), ("b", 2, 3)]
+    assert len(board) == 4
+
+
+def test_tournament_standings_after_mixed_results():
+    tournament = Tournament(seed=4)
+    with pytest.raises(ValueError, match="not started"):
+        tournament.door_groups()
+    players = {1: "ada", 2: "bob", 3: "ada"}  # two sessions can share a display name
+    for player, name in players.items():
+        tournament.join(player, name)
+    tournament.start_round()
+    with pytest.raises(ValueError, match="enter your name"):
+        tournament.pick(99, 0)
+
+    wins = dict.fromkeys(players, 0)
+    for _ in range(6):
+        game_round = tournament.start_round()
+        for player, (door, choice) in zip(players, [(0, "switch"), (1, "stay"), (2, "switch")]):
+            tournament.pick(player, door)
+            wins[player] += tournament.decide(player, choice)
+            assert game_round.won(player) == (door == game_round.car) ^ (choice == "switch")
+
+    assert len(set(wins.values())) > 1
+    expected = sorted((-w, 6, p) for p, w in wins.items())
+    assert tournament.standings() == [(players[p], -w, games) for w, games, p in expected]
+    assert tournament.standings(1) == tournament.standings()[:1]
@@ -0,0 +1,158 @@
+"""Tournament rounds: many players resolved against one shared deal.
+
+A host starts a round and the car is placed once for everybody. Players are
+indexed by the door they picked, so the host's reveal and the outcome of
+staying or switching are worked out once per door group (at most ``n_doors``
+times a round) rather than once per player, and a decision is a lookup into
+its group. Results feed a leaderboard that is kept sorted as they arrive.
+
+Players are identified by a key the caller controls (the app uses the
+server-side session id) and shown under the name they joined with:
+
+    tournament = Tournament(seed=1)
+    tournament.start_round()
+    tournament.join(7, "ada")
+    tournament.pick(7, 0)          # -> the group's MontyHallGame, already revealed
+    tournament.decide(7, "switch")
+    tournament.standings()         # -> [("ada", wins, games)]
+"""
+
+import threading
+from bisect import bisect_left, insort
+
+from game import MontyHallGame
+from seeding import make_rng
+
+
+class Round:
+    """One deal shared by every player of a tournament round."""
+
+    def __init__(self, number, n_doors, rng):
+        self.number = number
+        self.n_doors = n_doors
+        self.car = int(rng.integers(n_doors))
+        self._rng = rng
+        self._groups = {}  # picked door -> game revealed once for that door
+        self._outcomes = {}  # picked door -> {"stay": won, "switch": won}
+        self.players_by_pick = {}  # picked door -> players who picked it
+        self.picks = {}  # player -> picked door
+        self.choices = {}  # player -> "stay" or "switch"
+
+    def group(self, door):
+        """The game every player who picked ``door`` shares, revealed on first use."""
+        game = self._groups.get(door)
+        if game is None:
+            game = MontyHallGame(self.n_doors, rng=self._rng, car=self.car)
+            game.pick_door(door)
+            game.reveal()
+            self._groups[door] = game
+            self._outcomes[door] = {"stay": game.pick == self.car, "switch": game.switch_door == self.car}
+        return game
+
+    def pick(self, player, door):
+        """Put ``player`` in the group for ``door`` and return that group's game."""
+        if player in self.choices:
+            raise ValueError("you have already decided this round")
+        game = self.group(door)
+        previous = self.picks.get(player)
+        if previous is not None:
+            self.players_by_pick[previous].discard(player)
+        self.picks[player] = door
+        self.players_by_pick.setdefault(door, set()).add(player)
+        return game
+
+    def decide(self, player, choice):
+        """Resolve ``player``'s ``"stay"`` or ``"switch"``; return whether they won."""
+        if player not in self.picks:
+            raise ValueError("pick a door first")
+        if player in self.choices:
+            raise ValueError("you have already decided this round")
+        if choice not in ("stay", "switch"):
+            raise ValueError('choice must be "stay" or "switch"')
+        self.choices[player] = choice
+        return self._outcomes[self.picks[player]][choice]
+
+    def won(self, player):
+        """Whether ``player`` won this round, or ``None`` before they decide."""
+        choice = self.choices.get(player)
+        return None if choice is None else self._outcomes[self.picks[player]][choice]
+
+    def door_groups(self):
+        """``(door, players, stay wins)`` for every picked door, lowest door first."""
+        return [
+            (door, len(self.players_by_pick[door]), self._outcomes[door]["stay"])
+            for door in sorted(self.players_by_pick)
+            if self.players_by_pick[door]
+        ]
+
+
+class Leaderboard:
+    """Player standings, kept sorted by wins (then fewest games) as results arrive."""
+
+    def __init__(self):
+        self._scores = {}  # player -> (wins, games)
+        self._order = []  # sorted (-wins, games, player)
+
+    def __len__(self):
+        return len(self._scores)
+
+    def record(self, player, won):
+        wins, games = self._scores.get(player, (0, 0))
+        if games:
+            del self._order[bisect_left(self._order, (-wins, games, player))]
+        wins, games = wins + bool(won), games + 1
+        self._scores[player] = (wins, games)
+        insort(self._order, (-wins, games, player))
+
+    def top(self, n=None):
+        """``(player, wins, games)`` for the ``n`` best players, best first."""
+        return [(player, -wins, games) for wins, games, player in self._order[:n]]
+
+
+class Tournament:
+    """Rounds and standings shared by every session; safe to call from any thread."""
+
+    def __init__(self, n_doors=3, seed=None):
+        self.n_doors = n_doors
+        self._rng = make_rng(seed)
+        self._lock = threading.Lock()
+        self.round = None
+        self.leaderboard = Leaderboard()
+        self.names = {}  # player -> display name
+
+    def start_round(self):
+        with self._lock:
+            number = self.round.number + 1 if self.round else 1
+            self.round = Round(number, self.n_doors, self._rng)
+            return self.round
+
+    def _current(self):
+        if self.round is None:
+            raise ValueError("the host has not started a round yet")
+        return self.round
+
+    def join(self, player, name):
+        """Register ``player`` under ``name``, or rename them."""
+        with self._lock:
+            self.names[player] = name
+
+    def pick(self, player, door):
+        with self._lock:
+            if player not in self.names:
+                raise ValueError("enter your name to play")
+            return self._current().pick(player, door)
+
+    def decide(self, player, choice):
+        with self._lock:
+            won = self._current().decide(player, choice)
+            self.leaderboard.record(player, won)
+            return won
+
+    def door_groups(self):
+        with self._lock:
+            return self._current().door_groups()
+
+    def standings(self, n=None):
+        """``(name, wins, games)`` for the ``n`` best players, best first."""
+        with self._lock:
+            return [(self.names[player], wins, games) for player, wins, games in self.leaderboard.top(n)]